@@ -14,6 +14,9 @@ def as_obj(x):
     try:
         if hasattr(x, "model_dump"):
             return x.model_dump()
+        if hasattr(x, "fields_dict"):
+            # Slotted dataclasses (JobPosting) have no __dict__
+            return x.fields_dict()
         d = getattr(x, "__dict__", None)
         if isinstance(d, dict):
             return dict(d)
@@ -37,7 +37,7 @@ async def main():
 
         # Print a richer sample of the first job
         print("\nSample job (first item):")
-        sample = jobs[0].__dict__
+        sample = jobs[0].fields_dict()
         for k, v in sample.items():
             if k == "description" and v:
                 preview = (v[:200] + "...") if len(v) > 200 else v
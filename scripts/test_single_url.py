@@ -7,7 +7,7 @@ async def test_url(url: str):
     async with JobService() as svc:
         job = await svc.parse_job_url(url)
         # Print the dictionary representation of the JobPosting object
-        print(job.__dict__)
+        print(job.fields_dict())
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -1,33 +1,59 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
 import aiohttp
 import logging
 
 T = TypeVar("T")
 
 class BaseCrawler(Generic[T]):
+    CONNECTION_LIMIT = 10
+    CONNECTION_LIMIT_PER_HOST = 3
+
     def __init__(self, cache_ttl: timedelta = timedelta(hours=1)):
         self.session: Optional[aiohttp.ClientSession] = None
         self.cache: Dict[str, List[T]] = {}
         self.last_crawl: Dict[str, datetime] = {}
         self.cache_ttl = cache_ttl
+        # Running totals over every list in self.cache, kept in step by store_cache
+        self.total_count = 0
+        self.remote_count = 0
+        # (total, remote) each cached list contributed when it was stored; its
+        # postings' remote_ok may change later (enrichment), so it isn't recounted
+        self._cache_counts: Dict[str, Tuple[int, int]] = {}
         self.log = logging.getLogger(self.__class__.__name__)
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self.session is None or self.session.closed:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/123.0 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(headers=headers, timeout=timeout)
+            self.session = self.make_session(self.CONNECTION_LIMIT)
         return self.session
 
+    @classmethod
+    def make_session(cls, limit: int) -> aiohttp.ClientSession:
+        """Client session with the crawler headers and timeout, and a connector
+        allowing `limit` connections overall. Must be called with a loop running.
+
+        Several crawlers may share one session (assign it to their `session`);
+        whichever closes it first closes it for all.
+        """
+        headers = {
+            "User-Agent": (
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/123.0 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        }
+        timeout = aiohttp.ClientTimeout(total=30)
+        # Connection caps and DNS caching are enforced by the connector itself
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+        )
+        return aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector)
+
     # Backwards-compatible: keep create_session but delegate
     async def create_session(self):
         await self._ensure_session()
@@ -44,6 +70,20 @@ class BaseCrawler(Generic[T]):
         ts = self.last_crawl.get(key)
         return bool(ts and (datetime.now(timezone.utc) - ts) < self.cache_ttl)
 
+    @staticmethod
+    def _remote_in(items: List[T]) -> int:
+        return sum(1 for j in items if getattr(j, "remote_ok", False))
+
+    def store_cache(self, key: str, items: List[T]) -> None:
+        """Cache `items` under `key`, stamp the crawl time and update the counters."""
+        old_total, old_remote = self._cache_counts.get(key, (0, 0))
+        total, remote = len(items), self._remote_in(items)
+        self.cache[key] = items
+        self._cache_counts[key] = (total, remote)
+        self.total_count += total - old_total
+        self.remote_count += remote - old_remote
+        self.last_crawl[key] = datetime.now(timezone.utc)
+
     async def get_text(self, url: str, **kwargs) -> Optional[str]:
         session = await self._ensure_session()
         try:
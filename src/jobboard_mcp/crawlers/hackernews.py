@@ -41,9 +41,8 @@ class HackerNewsCrawler(BaseCrawler[JobPosting]):
             thread_url = await self._discover_latest_thread_url()
         if not thread_url:
             self.log.warning("Could not discover latest Who's Hiring thread.")
-            print("DEBUG HN: discovery failed (no thread_url)")
             return []
-        print(f"DEBUG HN: thread_url={thread_url}")
+        self.log.debug("thread_url=%s", thread_url)
 
         jobs: List[JobPosting] = []
 
@@ -64,7 +63,7 @@ class HackerNewsCrawler(BaseCrawler[JobPosting]):
             )
             jobs.extend(page_jobs)
             total_seen += len(page_jobs)
-            print(f"DEBUG HN: page jobs={len(page_jobs)} total_seen={total_seen + len(page_jobs)}")
+            self.log.debug("page jobs=%d total_seen=%d", len(page_jobs), total_seen)
             if per_page_limit and total_seen >= per_page_limit:
                 break
 
@@ -78,8 +77,7 @@ class HackerNewsCrawler(BaseCrawler[JobPosting]):
                 next_page = None
 
         # Cache and return
-        self.cache[self.KEY] = jobs
-        self.last_crawl[self.KEY] = datetime.now(timezone.utc)
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     async def _discover_latest_thread_url(self) -> Optional[str]:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urljoin
 
@@ -11,6 +10,15 @@ from .base import BaseCrawler
 from ..models.job import JobPosting
 
 
+# Substrings that mark a parenthesized title part as a location, as one
+# alternation so a part is scanned once rather than once per token
+_LOC_TOKEN_RE = re.compile("|".join(map(re.escape, (
+    "remote", "us", "usa", "united states", "uk", "london", "nyc", "sf", "san francisco",
+    "berlin", "europe", "eu", "canada", "toronto", "vancouver", "australia", "singapore",
+    "boston", "seattle", "la", "los angeles", "austin", "dublin", "paris", "amsterdam",
+))))
+
+
 class HackerNewsJobsCrawler(BaseCrawler[JobPosting]):
     """
     Crawler for https://news.ycombinator.com/jobs (HN Jobs board).
@@ -56,8 +64,7 @@ class HackerNewsJobsCrawler(BaseCrawler[JobPosting]):
             else:
                 next_url = None
 
-        self.cache[self.KEY] = jobs
-        self.last_crawl[self.KEY] = datetime.now(timezone.utc)
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     def _parse_jobs_page(self, soup: BeautifulSoup, per_page_limit: int) -> List[JobPosting]:
@@ -134,19 +141,13 @@ class HackerNewsJobsCrawler(BaseCrawler[JobPosting]):
 
         parens = re.findall(r"\(([^)]+)\)", t)
 
-        loc_tokens = {
-            "remote", "us", "usa", "united states", "uk", "london", "nyc", "sf", "san francisco",
-            "berlin", "europe", "eu", "canada", "toronto", "vancouver", "australia", "singapore",
-            "boston", "seattle", "la", "los angeles", "austin", "dublin", "paris", "amsterdam"
-        }
-
         def looks_like_location(s: str) -> bool:
             s_low = s.strip().lower()
             if not s_low:
                 return False
             if s_low.startswith("yc "):
                 return False
-            if any(tok in s_low for tok in loc_tokens):
+            if _LOC_TOKEN_RE.search(s_low):
                 return True
             if len(s_low) <= 6 and s_low.replace("/", "").replace("-", "").isalpha():
                 return True
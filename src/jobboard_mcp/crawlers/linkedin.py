@@ -23,9 +23,7 @@ class LinkedInCrawler(BaseCrawler[JobPosting]):
                 remote_ok=True,
             )
         ]
-        self.cache[self.KEY] = jobs
-        from datetime import datetime
-        self.last_crawl[self.KEY] = datetime.now()
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     def _filter(self, jobs: List[JobPosting], keywords: Optional[List[str]]) -> List[JobPosting]:
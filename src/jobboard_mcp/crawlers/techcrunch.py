@@ -31,9 +31,7 @@ class TechCrunchCrawler(BaseCrawler[JobPosting]):
                             source="TechCrunch",
                         )
                     )
-        self.cache[self.KEY] = jobs
-        from datetime import datetime
-        self.last_crawl[self.KEY] = datetime.now()
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     def _filter(self, jobs: List[JobPosting], keywords: Optional[List[str]]) -> List[JobPosting]:
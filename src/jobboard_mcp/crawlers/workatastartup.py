@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -10,6 +9,24 @@ from bs4 import BeautifulSoup  # type: ignore
 from .base import BaseCrawler
 from ..models.job import JobPosting
 
+# Word lists for classifying listing details and spotting remote jobs (any
+# substring hit counts), compiled as alternations
+_JOB_TYPE_RE = re.compile("|".join(map(re.escape, (
+    "fulltime", "full-time", "part-time", "parttime", "contract", "internship",
+))))
+_CATEGORY_RE = re.compile("|".join(map(re.escape, (
+    "backend", "frontend", "full stack", "fullstack", "devops", "ml", "ios", "android",
+    "embedded", "hardware",
+))))
+_LOCATION_WORD_RE = re.compile("|".join(map(re.escape, (
+    "remote", "san francisco", "new york", "palo alto", "ca", "ny", "us", "united states",
+    "hybrid", "santa clara", "philadelphia", "austin", "anywhere",
+))))
+_REMOTE_TERM_RE = re.compile("|".join(map(re.escape, (
+    "remote", "anywhere", "work from home", "wfh", "distributed", "us remote", "remote (us)",
+    "remote/", "hybrid",
+))))
+
 
 class WorkAtStartupCrawler(BaseCrawler[JobPosting]):
     """
@@ -65,8 +82,7 @@ class WorkAtStartupCrawler(BaseCrawler[JobPosting]):
                 await self.sleep_polite(0.3)  # Be respectful
 
         # Cache and return
-        self.cache[self.KEY] = jobs
-        self.last_crawl[self.KEY] = datetime.now(timezone.utc)
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     def _parse_job_listings(
@@ -223,13 +239,13 @@ class WorkAtStartupCrawler(BaseCrawler[JobPosting]):
             part_lower = part.lower()
             
             # Identify job type
-            if any(jt in part_lower for jt in ["fulltime", "full-time", "part-time", "parttime", "contract", "internship"]):
+            if _JOB_TYPE_RE.search(part_lower):
                 job_type = part
             # Identify job category/tech area
-            elif any(cat_word in part_lower for cat_word in ["backend", "frontend", "full stack", "fullstack", "devops", "ml", "ios", "android", "embedded", "hardware"]):
+            elif _CATEGORY_RE.search(part_lower):
                 category = part
             # Identify location (anything with geographic indicators or 'remote')
-            elif any(loc_word in part_lower for loc_word in ["remote", "san francisco", "new york", "palo alto", "ca", "ny", "us", "united states", "hybrid", "santa clara", "philadelphia", "austin", "anywhere"]) or ", " in part:
+            elif _LOCATION_WORD_RE.search(part_lower) or ", " in part:
                 location = part
         
         return location, job_type, category
@@ -237,11 +253,7 @@ class WorkAtStartupCrawler(BaseCrawler[JobPosting]):
     def _is_remote_job(self, location: Optional[str], title: str, description: str) -> bool:
         """Check if job is remote-friendly"""
         searchable_text = f"{location or ''} {title} {description}".lower()
-        remote_terms = [
-            "remote", "anywhere", "work from home", "wfh", "distributed",
-            "us remote", "remote (us)", "remote/", "hybrid"
-        ]
-        return any(term in searchable_text for term in remote_terms)
+        return _REMOTE_TERM_RE.search(searchable_text) is not None
 
     def _filter(self, jobs: List[JobPosting], keywords: Optional[List[str]]) -> List[JobPosting]:
         """Standard keyword filtering"""
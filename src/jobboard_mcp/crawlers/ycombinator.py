@@ -3,7 +3,6 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from .base import BaseCrawler
 from ..models.job import JobPosting
-from datetime import datetime, timezone
 import re
 
 
@@ -48,8 +47,7 @@ class YCombinatorCrawler(BaseCrawler[JobPosting]):
             pages_fetched += 1
 
         # Cache and return filtered
-        self.cache[self.KEY] = jobs
-        self.last_crawl[self.KEY] = datetime.now(timezone.utc)
+        self.store_cache(self.KEY, jobs)
         return self._filter(jobs, keywords)
 
     def _parse_jobs_from_soup(self, soup: BeautifulSoup, base_url: str) -> List[JobPosting]:
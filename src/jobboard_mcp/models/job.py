@@ -1,9 +1,45 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
-@dataclass
+# Query parameters that only track where a click came from, including the
+# ATS boards' own (gh_src, lever-source), matched case-insensitively
+_TRACKING_PARAMS = frozenset({"ref", "source", "fbclid", "gclid", "gh_src", "lever-source"})
+_TRACKING_PREFIXES = ("utm_",)
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """`url` without fragment, tracking parameters or trailing slash, with
+    lowercased scheme and host, so one posting linked from different boards
+    compares equal. Cached: crawls see the same URLs again and again.
+
+    A URL urlsplit() rejects (e.g. an unbalanced "[" in the host) is only
+    stripped, so one bad link can't fail the posting built from it."""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = parts.query
+    if query:
+        # Filter the raw "k=v" pieces; nothing needs decoding to drop a key
+        kept = []
+        for piece in query.split("&"):
+            name = piece.split("=", 1)[0].lower()
+            if name and name not in _TRACKING_PARAMS and not name.startswith(_TRACKING_PREFIXES):
+                kept.append(piece)
+        query = "&".join(kept)
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
+# slots: no per-instance __dict__, which adds up across a search's worth of postings
+@dataclass(slots=True)
 class JobPosting:
     # Identity and provenance
     id: Optional[str] = None
@@ -33,6 +69,49 @@ class JobPosting:
     # New: internal routing key for JobService/crawlers (e.g., "ycombinator", "hackernews_jobs")
     source_key: Optional[str] = None
 
+    # Derived: dedupe key (canonical URL, or title/company when there is no URL), set in __post_init__
+    canonical_key: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    # Cache for lower_blob: (location, description) it was computed from, casefolded blob
+    _lower_blob: Tuple[str, str, str] = field(default=("", "", "\n"), init=False, repr=False, compare=False)
+
+    # Cache for tag_set: (tags list it was computed from, its length, the set)
+    _tag_set: Tuple[Optional[List[str]], int, frozenset] = field(
+        default=(None, 0, frozenset()), init=False, repr=False, compare=False
+    )
+
+    @property
+    def tag_set(self) -> frozenset:
+        """Tags stripped and lowercased, for the required-tags filter.
+
+        Recomputed only when tags is reassigned or changes length.
+        """
+        if not self.tags:
+            return frozenset()
+        tags, size, tag_set = self._tag_set
+        if tags is not self.tags or size != len(self.tags):
+            tag_set = frozenset(t.strip().lower() for t in self.tags if t and t.strip())
+            self._tag_set = (self.tags, len(self.tags), tag_set)
+        return tag_set
+
+    @property
+    def lower_blob(self) -> str:
+        """Casefolded location and description (newline-joined) for the text filters;
+        callers casefold their search text to match.
+
+        Computed once per job and recomputed only when location or description
+        is reassigned (e.g. by enrichment).
+        """
+        loc, desc, blob = self._lower_blob
+        if loc is not self.location or desc is not self.description:
+            blob = f"{self.location}\n{self.description}".casefold()
+            self._lower_blob = (self.location, self.description, blob)
+        return blob
+
+    def fields_dict(self) -> Dict[str, Any]:
+        """Shallow {field: value} mapping of the constructor fields."""
+        return {name: getattr(self, name) for name in _INIT_FIELDS}
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to standardized dictionary format."""
         from ..utils.fallback import assess_data_quality, to_standardized_dict
@@ -51,4 +130,14 @@ class JobPosting:
         # Ensure ID is set
         if not self.id:
             from ..utils.fallback import generate_fallback_id
-            self.id = generate_fallback_id(self.__dict__)
\ No newline at end of file
+            self.id = generate_fallback_id(self.fields_dict())
+
+        self.canonical_key = (
+            (canonical_url(self.url),)
+            if self.url
+            else (self.title, self.company)
+        )
+
+
+# Constructor field names in declaration order, for fields_dict()
+_INIT_FIELDS = tuple(f.name for f in fields(JobPosting) if f.init)
@@ -2,14 +2,14 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     heading: str
     html: Optional[str] = None
     text: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SalaryInfo:
     min: Optional[float] = None
     max: Optional[float] = None
@@ -18,7 +18,7 @@ class SalaryInfo:
     raw: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyProfile:
     name: Optional[str] = None
     tagline: Optional[str] = None
@@ -28,7 +28,7 @@ class CompanyProfile:
     locations: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedJob:
     # Core
     id: Optional[str] = None
@@ -76,17 +76,18 @@ class AshbyJobParser(Parser):
             loc = guess_location(ct)
             if loc:
                 job.location = loc
-            from ..utils import parse_salary_components, refine_location
+            from ..utils import parse_salary_and_location
             meta = normalize_text(ct)[:300]
-            sal = parse_salary_components(meta)
+            sal, job.location = parse_salary_and_location(meta, job.location or "Unknown")
             if sal:
                 mn, mx, cur, per, raw = sal
                 from ..models import SalaryInfo
                 job.salaryInfo = SalaryInfo(min=mn, max=mx, currency=cur, periodicity=per, raw=raw)
-            job.location = refine_location(meta, job.location or "Unknown")
 
-        if job.descriptionText:
-            job.techStack = extract_tech_stack(job.descriptionText)
+        desc_text = job.descriptionText or ""
+        desc_len = len(desc_text)
+        if desc_len:
+            job.techStack = extract_tech_stack(desc_text)
 
         # Extract lists by section heading classification
         for s in sections:
@@ -109,7 +110,7 @@ class AshbyJobParser(Parser):
             score += 25
         if job.company:
             score += 15
-        if job.descriptionText and len(job.descriptionText) > 120:
+        if desc_len > 120:
             score += 40
         if sections:
             score += 20
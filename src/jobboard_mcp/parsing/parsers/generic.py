@@ -62,14 +62,16 @@ class GenericHtmlParser(Parser):
         job.descriptionText = "\n\n".join([s.text for s in sections if s.text]) or None
         job.descriptionHtml = "\n".join([s.html for s in sections if s.html]) or None
 
-        if job.descriptionText:
-            job.techStack = extract_tech_stack(job.descriptionText)
+        desc_text = job.descriptionText or ""
+        desc_len = len(desc_text)
+        if desc_len:
+            job.techStack = extract_tech_stack(desc_text)
 
         # Scoring: based on description length and sections availability
         score = 0
         if job.title:
             score += 15
-        if job.descriptionText and len(job.descriptionText) > 200:
+        if desc_len > 200:
             score += 60
         if sections:
             score += 25
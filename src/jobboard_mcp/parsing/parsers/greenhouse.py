@@ -30,17 +30,18 @@ class GreenhouseJobParser(Parser):
     def parse(self, url: str, doc: BeautifulSoup) -> ParsedJob:
         job = ParsedJob(parser=self.name, url=url, source="Greenhouse")
 
+        # Page <title> parts, read once and reused for company inference below
+        page_title = (doc.title.string or "") if doc.title else ""
+        title_parts = [p.strip() for p in page_title.split("-") if p.strip()]
+
         # Title heuristics
         h = doc.select_one("h1, h2")
         if h:
             job.title = normalize_text(h.get_text(" "))
 
         # Company name best-effort from title tag
-        page_title = (doc.title.string or "") if doc.title else ""
-        if page_title:
-            parts = [p.strip() for p in page_title.split("-") if p.strip()]
-            if len(parts) >= 2:
-                job.company = parts[-1]
+        if len(title_parts) >= 2:
+            job.company = title_parts[-1]
 
         # Strip obvious non-description UI chrome to reduce noise
         for el in doc.select("nav, header, footer, form, aside, [role='dialog'], .overlay, .modal, .application, .apply, .field, .input, .select"):
@@ -50,8 +51,9 @@ class GreenhouseJobParser(Parser):
                 pass
 
         # Prefer a more specific description container to avoid grabbing the entire app chrome
+        body = doc.select_one(".content .body")
         container = (
-            doc.select_one(".content .body")
+            body
             or doc.select_one(".content .section")
             or doc.select_one(".application .content")
             or doc.select_one(".opening .content")
@@ -63,22 +65,25 @@ class GreenhouseJobParser(Parser):
             or doc
         )
 
-        sections: List[Section] = []
-        # Many GH pages use h2/h3 to segment content
-        for heading_tag in container.select("h2, h3"):
-            heading = normalize_text(heading_tag.get_text(" "))
-            html_parts: List[str] = []
-            for sib in heading_tag.find_all_next():
-                if sib == heading_tag:
-                    continue
-                if sib.name in ("h2", "h3"):
-                    break
-                if sib.name in ("div", "p", "ul", "ol", "li"):
-                    html_parts.append(str(sib))
-            html = sanitize_html("\n".join(html_parts)) if html_parts else None
-            text = normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n")) if html else None
-            if heading or html or text:
-                sections.append(Section(heading=heading or "", html=html, text=text))
+        # Standard boards put headings and copy as direct children of .content .body;
+        # group those in one pass and only walk h2/h3 boundaries when that finds nothing.
+        sections: List[Section] = self._body_sections(body) if body else []
+        if not sections:
+            # Many GH pages use h2/h3 to segment content
+            for heading_tag in container.select("h2, h3"):
+                heading = normalize_text(heading_tag.get_text(" "))
+                html_parts: List[str] = []
+                for sib in heading_tag.find_all_next():
+                    if sib == heading_tag:
+                        continue
+                    if sib.name in ("h2", "h3"):
+                        break
+                    if sib.name in ("div", "p", "ul", "ol", "li"):
+                        html_parts.append(str(sib))
+                html = sanitize_html("\n".join(html_parts)) if html_parts else None
+                text = normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n")) if html else None
+                if heading or html or text:
+                    sections.append(Section(heading=heading or "", html=html, text=text))
 
         # If no headings found, attempt heuristic pseudo-sections by keyword anchors within container
         if not sections:
@@ -126,28 +131,24 @@ class GreenhouseJobParser(Parser):
         loc = guess_location(ctxt) if ctxt else None
         if loc:
             job.location = loc
-        from ..utils import parse_salary_components, refine_location
+        from ..utils import parse_salary_and_location
         meta = normalize_text(ctxt)[:300]
-        sal = parse_salary_components(meta)
+        sal, job.location = parse_salary_and_location(meta, job.location or "Unknown")
         if sal:
             mn, mx, cur, per, raw = sal
             from ..models import SalaryInfo
             job.salaryInfo = SalaryInfo(min=mn, max=mx, currency=cur, periodicity=per, raw=raw)
-        job.location = refine_location(meta, job.location or "Unknown")
-
-        # Company inference from meta/site_name or page title if missing
-        if not job.company and doc.title and doc.title.string:
-            pt = doc.title.string
-            parts = [p.strip() for p in pt.split("-") if p.strip()]
-            if len(parts) >= 2:
-                job.company = parts[-1]
+
+        # Company inference from meta/site_name if the page title gave none
         if not job.company:
             ogsn = doc.find("meta", attrs={"property": "og:site_name"})
             if ogsn and ogsn.get("content"):
                 job.company = normalize_text(ogsn["content"]) or job.company
 
-        if job.descriptionText:
-            job.techStack = extract_tech_stack(job.descriptionText)
+        desc_text = job.descriptionText or ""
+        desc_len = len(desc_text)
+        if desc_len:
+            job.techStack = extract_tech_stack(desc_text)
 
         # Extract lists by section heading classification
         for s in sections:
@@ -170,7 +171,7 @@ class GreenhouseJobParser(Parser):
             score += 25
         if job.company:
             score += 15
-        if job.descriptionText and len(job.descriptionText) > 120:
+        if desc_len > 120:
             score += 40
         if sections:
             score += 20
@@ -190,3 +191,26 @@ class GreenhouseJobParser(Parser):
         )
 
         return job
+
+    def _body_sections(self, body: BeautifulSoup) -> List[Section]:
+        sections: List[Section] = []
+        heading = None
+        parts: List[str] = []
+
+        def flush() -> None:
+            html = sanitize_html("\n".join(parts)) if parts else None
+            text = normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n")) if html else None
+            if heading or text:
+                sections.append(Section(heading=heading or "", html=html, text=text))
+
+        for child in body.find_all(recursive=False):
+            if child.name in ("h2", "h3"):
+                if heading is not None:
+                    flush()
+                heading = normalize_text(child.get_text(" "))
+                parts = []
+            elif heading is not None and child.name in ("div", "p", "ul", "ol", "li"):
+                parts.append(str(child))
+        if heading is not None:
+            flush()
+        return sections
@@ -42,6 +42,9 @@ class LeverJobParser(Parser):
     def parse(self, url: str, doc: BeautifulSoup) -> ParsedJob:
         job = ParsedJob(parser=self.name, url=url, source="Lever")
 
+        page_title = (doc.title.string or "") if doc.title else ""
+        title_parts = [p.strip() for p in page_title.split("-") if p.strip()]
+
         headline = doc.select_one(".posting-headline") or doc
         # Title: h2 or h1 within headline
         h = headline.select_one("h2, h1")
@@ -49,36 +52,36 @@ class LeverJobParser(Parser):
             job.title = normalize_text(h.get_text(" "))
 
         # Company from document title or headline text (best-effort)
-        page_title = (doc.title.string or "") if doc.title else ""
-        if page_title:
-            parts = [p.strip() for p in page_title.split("-") if p.strip()]
-            if len(parts) >= 2:
-                job.company = parts[-1]
+        if len(title_parts) >= 2:
+            job.company = title_parts[-1]
 
         # Container for sections
         container = (
             doc.select_one(".posting") or doc.select_one(".posting-description") or doc
         )
 
-        sections: List[Section] = []
-        for heading_tag in container.select("h2, h3"):
-            heading = normalize_text(heading_tag.get_text(" "))
-            html_parts: List[str] = []
-            for sib in heading_tag.find_all_next():
-                if sib == heading_tag:
-                    continue
-                if sib.name in ("h2", "h3"):
-                    break
-                if sib.name in ("div", "p", "ul", "ol", "li"):
-                    html_parts.append(str(sib))
-            html = sanitize_html("\n".join(html_parts)) if html_parts else None
-            text = (
-                normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n"))
-                if html
-                else None
-            )
-            if heading or html or text:
-                sections.append(Section(heading=heading or "", html=html, text=text))
+        # Lever wraps each block in a .section with its own .section-title; read
+        # those directly and only walk h2/h3 boundaries when the markup differs.
+        sections: List[Section] = self._posting_sections(container)
+        if not sections:
+            for heading_tag in container.select("h2, h3"):
+                heading = normalize_text(heading_tag.get_text(" "))
+                html_parts: List[str] = []
+                for sib in heading_tag.find_all_next():
+                    if sib == heading_tag:
+                        continue
+                    if sib.name in ("h2", "h3"):
+                        break
+                    if sib.name in ("div", "p", "ul", "ol", "li"):
+                        html_parts.append(str(sib))
+                html = sanitize_html("\n".join(html_parts)) if html_parts else None
+                text = (
+                    normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n"))
+                    if html
+                    else None
+                )
+                if heading or html or text:
+                    sections.append(Section(heading=heading or "", html=html, text=text))
 
         job.sections = sections
         job.descriptionText = "\n\n".join([s.text for s in sections if s.text]) or None
@@ -89,10 +92,10 @@ class LeverJobParser(Parser):
         loc = guess_location(htxt) if htxt else None
         if loc:
             job.location = loc
-        from ..utils import parse_salary_components, refine_location
+        from ..utils import parse_salary_and_location
 
         meta = normalize_text(htxt)[:300]
-        sal = parse_salary_components(meta)
+        sal, job.location = parse_salary_and_location(meta, job.location or "Unknown")
         if sal:
             mn, mx, cur, per, raw = sal
             from ..models import SalaryInfo
@@ -100,10 +103,11 @@ class LeverJobParser(Parser):
             job.salaryInfo = SalaryInfo(
                 min=mn, max=mx, currency=cur, periodicity=per, raw=raw
             )
-        job.location = refine_location(meta, job.location or "Unknown")
 
-        if job.descriptionText:
-            job.techStack = extract_tech_stack(job.descriptionText)
+        desc_text = job.descriptionText or ""
+        desc_len = len(desc_text)
+        if desc_len:
+            job.techStack = extract_tech_stack(desc_text)
 
         # Extract lists by section heading classification
         for s in sections:
@@ -126,7 +130,7 @@ class LeverJobParser(Parser):
             score += 25
         if job.company:
             score += 15
-        if job.descriptionText and len(job.descriptionText) > 120:
+        if desc_len > 120:
             score += 40
         if sections:
             score += 20
@@ -146,3 +150,20 @@ class LeverJobParser(Parser):
         )
 
         return job
+
+    def _posting_sections(self, container: BeautifulSoup) -> List[Section]:
+        sections: List[Section] = []
+        for node in container.select(".section"):
+            title = node.select_one(".section-title, h3, h2")
+            heading = normalize_text(title.get_text(" ")) if title else ""
+            body = node.select_one(".section-content") or node
+            parts = [str(c) for c in body.children if c is not title and str(c).strip()]
+            html = sanitize_html("\n".join(parts)) if parts else None
+            text = (
+                normalize_text(BeautifulSoup(html or "", "html.parser").get_text(" \n"))
+                if html
+                else None
+            )
+            if heading or text:
+                sections.append(Section(heading=heading, html=html, text=text))
+        return sections
@@ -49,15 +49,13 @@ class YcJobParser(Parser):
             if loc:
                 job.location = loc
             # Salary/location normalization (best-effort from header)
-            from ..utils import parse_salary_components, refine_location
+            from ..utils import parse_salary_and_location
             meta_text = header_text[:300]
-            sal = parse_salary_components(meta_text)
+            sal, job.location = parse_salary_and_location(meta_text, job.location or "Unknown")
             if sal:
                 mn, mx, cur, per, raw = sal
                 from ..models import SalaryInfo
                 job.salaryInfo = SalaryInfo(min=mn, max=mx, currency=cur, periodicity=per, raw=raw)
-            rl = refine_location(meta_text, job.location or "Unknown")
-            job.location = rl
 
         # Sections: collect h2.ycdc-section-title and following content until next h2
         sections: List[Section] = []
@@ -84,8 +82,10 @@ class YcJobParser(Parser):
         job.descriptionHtml = "\n".join([s.html for s in sections if s.html]) or None
 
         # Derive tech stack from description
-        if job.descriptionText:
-            job.techStack = extract_tech_stack(job.descriptionText)
+        desc_text = job.descriptionText or ""
+        desc_len = len(desc_text)
+        if desc_len:
+            job.techStack = extract_tech_stack(desc_text)
 
         # Extract lists by section heading classification
         for s in sections:
@@ -108,7 +108,7 @@ class YcJobParser(Parser):
             score += 25
         if job.company:
             score += 15
-        if job.descriptionText and len(job.descriptionText) > 120:
+        if desc_len > 120:
             score += 40
         if sections:
             score += 20
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import pickle
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Protocol, Optional, List, Tuple
+from typing import Protocol, Optional, List, Tuple, Union
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup  # type: ignore
 
 from .models import ParsedJob
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionResult:
     score: int
     reason: str
@@ -24,12 +30,47 @@ class Parser(Protocol):
         ...
 
 
+def content_key(url: str, html: Union[str, bytes]) -> Tuple[str, bytes]:
+    """Cache key for a (url, page content) pair; blake2b is cheap enough to hash whole pages."""
+    data = html.encode("utf-8", "surrogatepass") if isinstance(html, str) else html
+    return (url, hashlib.blake2b(data, digest_size=16).digest())
+
+
 class ParserRegistry:
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 128) -> None:
         self._parsers: List[Parser] = []
+        # (pattern over host + path, parser) for URLs whose parser is known up front
+        self._routes: List[Tuple["re.Pattern[str]", Parser]] = []
+        # (url, content digest) -> (parser name, detection, pickled ParsedJob), LRU-ordered
+        self._cache: "OrderedDict[Tuple[str, bytes], Tuple[str, DetectionResult, bytes]]" = OrderedDict()
+        self._cache_size = cache_size
+        # parse() may be called from several worker threads at once
+        self._lock = threading.Lock()
 
     def register(self, parser: Parser) -> None:
         self._parsers.append(parser)
+        # A new parser may change which one wins, so cached results are stale
+        self.clear_cache()
+
+    def route(self, pattern: str, parser: Parser) -> None:
+        r"""Send URLs matching `pattern` straight to `parser`, skipping detection.
+
+        `pattern` is matched (re.match) against the lowercased host, without a
+        leading "www.", followed by the path, e.g. r"jobs\.lever\.co/[^/]+/[^/]+".
+        """
+        self._routes.append((re.compile(pattern), parser))
+        self.clear_cache()
+
+    def _routed(self, url: str) -> Optional[Parser]:
+        if not self._routes:
+            return None
+        parts = urlsplit(url)
+        host = (parts.hostname or "").removeprefix("www.")
+        target = host + parts.path
+        for pattern, parser in self._routes:
+            if pattern.match(target):
+                return parser
+        return None
 
     def choose(self, url: str, doc: BeautifulSoup) -> Tuple[Parser, DetectionResult]:
         best: Optional[Tuple[Parser, DetectionResult]] = None
@@ -43,3 +84,41 @@ class ParserRegistry:
         assert best is not None, "No parsers registered"
         return best
 
+    def parse(
+        self, url: str, html: Union[str, bytes], features: str = "html.parser"
+    ) -> Tuple[Parser, DetectionResult, ParsedJob]:
+        """Choose a parser and parse `html`, memoized on (url, content hash).
+
+        Parsers are deterministic in (url, html), so repeat requests for an
+        unchanged page skip soup construction and the parser pipeline. Each
+        call returns a fresh ParsedJob, so callers may mutate the result.
+        """
+        key = content_key(url, html)
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+        if hit is not None:
+            name, det, blob = hit
+            parser = next((p for p in self._parsers if p.name == name), None)
+            if parser is not None:
+                return parser, det, pickle.loads(blob)
+
+        doc = BeautifulSoup(html, features)
+        routed = self._routed(url)
+        if routed is not None:
+            parser, det = routed, DetectionResult(score=100, reason="url route")
+        else:
+            parser, det = self.choose(url, doc)
+        parsed = parser.parse(url, doc)
+        if self._cache_size > 0:
+            blob = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._cache[key] = (parser.name, det, blob)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return parser, det, parsed
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
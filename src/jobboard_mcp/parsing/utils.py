@@ -1,30 +1,190 @@
+import functools
+import hashlib
+import html as _html
 import re
-from typing import List, Tuple, Optional, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Tuple, Optional, Dict
 
 from bs4 import BeautifulSoup  # type: ignore
 
+from lxml import etree as lxml_etree  # type: ignore
+from lxml import html as lxml_html  # type: ignore
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # regex alternations below are used instead
+    ahocorasick = None
+
+# Tree builder for the package's BeautifulSoup documents: the C-backed lxml one
+SOUP_FEATURES = "lxml"
+
 ALLOWED_TAGS = {"p", "ul", "ol", "li", "em", "strong", "br", "a", "h2", "h3"}
 
 
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.I)
+_META_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+
+
+def og_meta(html: str) -> Dict[str, str]:
+    """Open Graph properties ("og:title" etc.) from the page's <meta> tags.
+
+    Regex scan of the <head> only (the whole page when it has none), so no
+    DOM is built; attribute order within a tag doesn't matter.
+    """
+    head_end = _HEAD_END_RE.search(html)
+    head = html[: head_end.start()] if head_end else html
+    og: Dict[str, str] = {}
+    for tag in _META_TAG_RE.finditer(head):
+        attrs = {
+            m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3)
+            for m in _META_ATTR_RE.finditer(tag.group(0))
+        }
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        if key.startswith("og:") and key not in og and attrs.get("content"):
+            og[key] = " ".join(_html.unescape(attrs["content"]).split())
+    return og
+
+
+# -------- Memoization for pure text helpers --------
+
+# Inputs longer than this are keyed by digest so the cache doesn't pin whole pages
+_CACHE_INLINE_KEY_MAX = 256
+
+_CACHE_STATS: Dict[str, Dict[str, int]] = {}
+
+
+def _content_cached(
+    maxsize: int = 4096, min_len: int = 0
+) -> Callable[[Callable[[str], Any]], Callable[[str], Any]]:
+    """Bounded LRU for str -> value helpers. List results are copied on the way out.
+
+    Strings shorter than `min_len` skip the cache and call the helper directly.
+    """
+
+    def deco(fn: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache: "OrderedDict[Any, Any]" = OrderedDict()
+        lock = threading.Lock()
+        stats = _CACHE_STATS.setdefault(fn.__name__, {"hits": 0, "misses": 0})
+
+        @functools.wraps(fn)
+        def wrapper(text: str) -> Any:
+            if not isinstance(text, str) or len(text) < min_len:
+                return fn(text)
+            if len(text) <= _CACHE_INLINE_KEY_MAX:
+                key: Any = text
+            else:
+                key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    value = cache[key]
+                    return list(value) if isinstance(value, list) else value
+                stats["misses"] += 1
+            value = fn(text)
+            with lock:
+                cache[key] = value
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return list(value) if isinstance(value, list) else value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return deco
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters for the memoized parsing helpers."""
+    return {name: dict(counts) for name, counts in _CACHE_STATS.items()}
+
+
+@_content_cached()
 def sanitize_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup.find_all(True):
-        if tag.name not in ALLOWED_TAGS:
-            tag.unwrap()
-        elif tag.name == "a":
+    return _sanitize_fragment_lxml(html)
+
+
+# Feed size for the streaming sanitizer
+_SANITIZE_CHUNK = 64 * 1024
+
+
+class _SanitizeTarget:
+    """lxml parser target that writes allowed markup straight to a list of parts.
+
+    Parse events arrive tag by tag and no tree is built, so memory stays
+    bounded by the output rather than by the input document.
+    """
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+
+    def start(self, tag: str, attrib) -> None:
+        if tag not in ALLOWED_TAGS:
+            # dropped tag, children and text kept, like Tag.unwrap()
+            return
+        if tag == "a":
             # keep only href
-            attrs = {k: v for k, v in tag.attrs.items() if k == "href"}
-            tag.attrs = attrs
-        else:
-            tag.attrs = {}
-    return str(soup)
+            href = attrib.get("href")
+            if href:
+                self.parts.append('<a href="%s">' % _html.escape(href))
+                return
+        self.parts.append("<%s>" % tag)
+
+    def end(self, tag: str) -> None:
+        if tag in ALLOWED_TAGS and tag != "br":
+            self.parts.append("</%s>" % tag)
+
+    def data(self, text: str) -> None:
+        self.parts.append(_html.escape(text, quote=False))
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> str:
+        return "".join(self.parts)
+
+
+def _sanitize_fragment_lxml(html: str) -> str:
+    """sanitize_html as a single streaming lxml pass, skipping BeautifulSoup entirely."""
+    if not html or not html.strip():
+        return ""
+    parser = lxml_etree.HTMLParser(target=_SanitizeTarget())
+    # the wrapper keeps libxml2 from wrapping bare leading text in <p>; it is
+    # not an allowed tag, so it never reaches the output
+    parser.feed("<div>")
+    for i in range(0, len(html), _SANITIZE_CHUNK):
+        parser.feed(html[i:i + _SANITIZE_CHUNK])
+    parser.feed("</div>")
+    return parser.close()
+
+
+# UTF-8 punctuation that was decoded as cp1252 somewhere upstream
+_MOJIBAKE: Dict[str, str] = {
+    "â€¢": "•",
+    "â€™": "\u2019",
+    "â€˜": "\u2018",
+    "â€œ": "\u201c",
+    "â€\x9d": "\u201d",
+    "â€“": "\u2013",
+    "â€”": "\u2014",
+    "â€¦": "\u2026",
+}
+_MOJIBAKE_RE = re.compile("|".join(re.escape(k) for k in sorted(_MOJIBAKE, key=len, reverse=True)))
 
 
+# Titles, headings and list items normalize faster than a cache lookup;
+# only description-sized text is worth memoizing
+@_content_cached(min_len=1024)
 def normalize_text(text: str) -> str:
-    # Fix common UTF-8 artifacts like â€¢ becoming •
-    text = text.replace("â€¢", "•")
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    # Fix common UTF-8 artifacts like â€¢ becoming • in one pass; every
+    # artifact starts with "â", so clean text skips the regex entirely
+    if "â" in text:
+        text = _MOJIBAKE_RE.sub(lambda m: _MOJIBAKE[m.group(0)], text)
+    # str.split() with no separator splits on the same Unicode whitespace as
+    # \s and drops the ends, all in C, so this equals sub(r"\s+", " ").strip()
+    return " ".join(text.split())
 
 
 _TECH_DICT = {
@@ -40,19 +200,37 @@ _TECH_DICT = {
 }
 
 
+# Plain substring semantics, as with `key in text.lower()`: "Python3" and
+# "NodeJS" count. The lookahead reports overlapping keys too.
+_TECH_RE = re.compile("(?=(" + "|".join(map(re.escape, _TECH_DICT)) + "))", re.I)
+
+
+def _build_automaton(words: Dict[str, str]):
+    automaton = ahocorasick.Automaton()
+    for word, label in words.items():
+        automaton.add_word(word, (len(word), label))
+    automaton.make_automaton()
+    return automaton
+
+
+_TECH_AC = _build_automaton(_TECH_DICT) if ahocorasick is not None else None
+
+
+@_content_cached()
 def extract_tech_stack(text: str) -> List[str]:
-    lowered = text.lower()
-    found = []
-    for k, v in _TECH_DICT.items():
-        if k in lowered:
-            found.append(v)
-    return sorted(set(found))
+    if _TECH_AC is None:
+        return sorted({_TECH_DICT[m.group(1).lower()] for m in _TECH_RE.finditer(text)})
+    # Every occurrence, overlaps included: the same substring matches as _TECH_RE
+    return sorted({label for _end, (_length, label) in _TECH_AC.iter(text.lower())})
+
+
+_SALARY_RANGE_RE = re.compile(r"\$\s*([0-9][0-9,]*)\s*-\s*\$\s*([0-9][0-9,]*)")
 
 
 def normalize_salary(raw: str) -> Tuple[float, float, str, str]:
     # Very simple regex-based extractor; to be improved.
     # Returns (min, max, currency, periodicity)
-    m = re.search(r"\$\s*([0-9][0-9,]*)\s*-\s*\$\s*([0-9][0-9,]*)", raw)
+    m = _SALARY_RANGE_RE.search(raw)
     if m:
         mn = float(m.group(1).replace(",", ""))
         mx = float(m.group(2).replace(",", ""))
@@ -60,8 +238,12 @@ def normalize_salary(raw: str) -> Tuple[float, float, str, str]:
     return (0.0, 0.0, "", "")
 
 
+_REMOTE_RE = re.compile("remote", re.I)
+
+
 def guess_location(text: str) -> str:
-    if "remote" in text.lower():
+    # Case-insensitive search instead of lowering what is often a whole container's text
+    if _REMOTE_RE.search(text):
         return "Remote"
     return "Unknown"
 
@@ -75,56 +257,102 @@ _CURRENCY_MAP = {
 }
 
 
-def parse_salary_components(text: str) -> Optional[Tuple[float, float, str, str, str]]:
-    """
-    Try to extract (min, max, currency, periodicity, raw) from free text.
-    Supports formats like "$140k–$180k", "$140,000 - $180,000", "€70,000 per year", "£80k-£100k".
-    Periodicity heuristics: year|annual|yr, month|mo, hour|hr.
-    Returns None if not found.
-    """
-    if not text:
-        return None
-    t = text.lower().replace("\u2013", "-").replace("\u2014", "-")  # normalize dashes
+# Every keyword parse_salary_components / refine_location look for, mapped to a
+# label. One case-insensitive scan of the original text yields the full label
+# set for both, so long descriptions are never copied just to lowercase them.
+_META_KEYWORDS: Dict[str, str] = {
+    # currency symbols
+    "$": "cur:$",
+    "£": "cur:£",
+    "€": "cur:€",
+    # periodicity
+    "per month": "per:month",
+    "/mo": "per:month",
+    "monthly": "per:month",
+    "per mo": "per:month",
+    "per hour": "per:hour",
+    "/hr": "per:hour",
+    "hourly": "per:hour",
+    "per hr": "per:hour",
+    "per year": "per:year",
+    "/yr": "per:year",
+    "yearly": "per:year",
+    "annual": "per:year",
+    "annually": "per:year",
+    # location hints
+    "hybrid": "loc:hybrid",
+    "remote": "loc:remote",
+    "eu": "loc:eu",
+    "us": "loc:us",
+    "usa": "loc:us",
+    "united states": "loc:us",
+    "ca": "loc:ca",
+    "canada": "loc:ca",
+    "san francisco": "loc:sf",
+    "new york": "loc:ny",
+    "london": "loc:london",
+    "berlin": "loc:berlin",
+}
+
+# Zero-width lookahead so overlapping keywords are all reported, matching the
+# plain substring checks this replaced.
+_META_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_META_KEYWORDS, key=len, reverse=True))
+    + "))",
+    re.IGNORECASE,
+)
+
+_SAL_RANGE2_RE = re.compile(r"(\d+[\d,]*\s*k?)\s*[-to\u2013\u2014]+\s*(\d+[\d,]*\s*k?)", re.IGNORECASE)
+_SAL_SINGLE_RE = re.compile(r"(\d+[\d,]*\s*k?)", re.IGNORECASE)
+
+
+def _meta_labels(text: str) -> set:
+    labels = set()
+    for m in _META_RE.finditer(text):
+        # IGNORECASE also folds a few exotic code points (e.g. U+017F) that
+        # lower() would not map onto a keyword; skip those
+        label = _META_KEYWORDS.get(m.group(1).lower())
+        if label is not None:
+            labels.add(label)
+    return labels
+
+
+def _salary_from(text: str, labels: set) -> Optional[Tuple[float, float, str, str, str]]:
     # currency symbol
     cur_sym = None
     for sym in _CURRENCY_MAP:
-        if sym in text:
+        if "cur:" + sym in labels:
             cur_sym = sym
             break
     currency = _CURRENCY_MAP.get(cur_sym or "", "")
 
     # Extract numbers with optional k and thousands separators
     # Examples: 140k - 180k, 140,000 - 180,000, 70k
-    m = re.search(r"(\d+[\d,]*\s*(k)?)\s*[-to–]+\s*(\d+[\d,]*\s*(k)?)", t)
-    single = re.search(r"(\d+[\d,]*\s*(k)?)", t) if not m else None
+    m = _SAL_RANGE2_RE.search(text)
+    single = _SAL_SINGLE_RE.search(text) if not m else None
 
     mn = mx = None
     if m:
-        g1, k1, g2, k2 = m.group(1), m.group(2), m.group(3), m.group(4)
-        def to_num(g, kflag):
-            val = float(g.replace(",", "").replace(" ", ""))
-            if kflag:
-                val *= 1000.0
-            return val
         # remove trailing k letters in numeric conversion
         def clean_num(s: str) -> Tuple[float, bool]:
-            kflag = s.strip().endswith("k")
-            s2 = s.strip().rstrip("k").replace(",", "")
+            s = s.strip().lower()
+            kflag = s.endswith("k")
+            s2 = s.rstrip("k").replace(",", "")
             return (float(s2), kflag)
-        v1_raw, v2_raw = g1, g2
-        v1, kf1 = clean_num(v1_raw)
-        v2, kf2 = clean_num(v2_raw)
+        v1, kf1 = clean_num(m.group(1))
+        v2, kf2 = clean_num(m.group(2))
         if kf1:
             v1 *= 1000.0
         if kf2:
             v2 *= 1000.0
         mn, mx = v1, v2
     elif single:
-        g1 = single.group(1)
-        s_clean = g1.strip().rstrip("k").replace(",", "")
+        g1 = single.group(1).strip().lower()
+        s_clean = g1.rstrip("k").replace(",", "")
         try:
             val = float(s_clean)
-            if g1.strip().endswith("k"):
+            if g1.endswith("k"):
                 val *= 1000.0
             mn = mx = val
         except Exception:
@@ -134,44 +362,67 @@ def parse_salary_components(text: str) -> Optional[Tuple[float, float, str, str,
 
     # periodicity
     period = "year"
-    if any(p in t for p in ["per month", "/mo", "monthly", "per mo"]):
+    if "per:month" in labels:
         period = "month"
-    elif any(p in t for p in ["per hour", "/hr", "hourly", "per hr"]):
+    elif "per:hour" in labels:
         period = "hour"
-    elif any(p in t for p in ["per year", "/yr", "yearly", "annual", "annually"]):
-        period = "year"
 
     raw = text.strip()
     return (float(mn), float(mx), currency, period, raw)
 
 
-def refine_location(text: str, fallback: str = "Unknown") -> str:
-    """Improve location guess with common patterns like Remote, Hybrid, EU Remote, US/CA, etc."""
-    if not text:
-        return fallback
-    tl = text.lower()
-    if "hybrid" in tl:
+def _location_from(labels: set, fallback: str) -> str:
+    if "loc:hybrid" in labels:
         return "Hybrid"
-    if "remote" in tl:
-        if "eu" in tl:
+    if "loc:remote" in labels:
+        if "loc:eu" in labels:
             return "EU Remote"
-        if "us" in tl or "usa" in tl or "united states" in tl:
+        if "loc:us" in labels:
             return "US Remote"
-        if "ca" in tl or "canada" in tl:
+        if "loc:ca" in labels:
             return "CA Remote"
         return "Remote"
     # simple city/country hints
-    if "san francisco" in tl:
+    if "loc:sf" in labels:
         return "San Francisco, CA"
-    if "new york" in tl:
+    if "loc:ny" in labels:
         return "New York, NY"
-    if "london" in tl:
+    if "loc:london" in labels:
         return "London, UK"
-    if "berlin" in tl:
+    if "loc:berlin" in labels:
         return "Berlin, DE"
     return fallback
 
 
+def parse_salary_components(text: str) -> Optional[Tuple[float, float, str, str, str]]:
+    """
+    Try to extract (min, max, currency, periodicity, raw) from free text.
+    Supports formats like "$140k–$180k", "$140,000 - $180,000", "€70,000 per year", "£80k-£100k".
+    Periodicity heuristics: year|annual|yr, month|mo, hour|hr.
+    Returns None if not found.
+    """
+    if not text:
+        return None
+    return _salary_from(text, _meta_labels(text))
+
+
+def refine_location(text: str, fallback: str = "Unknown") -> str:
+    """Improve location guess with common patterns like Remote, Hybrid, EU Remote, US/CA, etc."""
+    if not text:
+        return fallback
+    return _location_from(_meta_labels(text), fallback)
+
+
+def parse_salary_and_location(
+    text: str, fallback: str = "Unknown"
+) -> Tuple[Optional[Tuple[float, float, str, str, str]], str]:
+    """parse_salary_components and refine_location over the same text, scanning it once."""
+    if not text:
+        return (None, fallback)
+    labels = _meta_labels(text)
+    return (_salary_from(text, labels), _location_from(labels, fallback))
+
+
 # -------- Company profile helpers --------
 
 def extract_company_links(doc) -> Dict[str, Optional[str]]:
@@ -226,34 +477,32 @@ def extract_company_tagline(doc) -> Optional[str]:
     return None
 
 
+# "company" alone already covers "about the company"; the rest are kept for readability
+_ABOUT_RE = re.compile("about the company|about us|company", re.I)
+
+
 def find_about_company(sections: List["Section"]) -> Tuple[Optional[str], Optional[str]]:
     """Return (text, html) for an 'About the company' section when present."""
     if not sections:
         return (None, None)
-    keys = [
-        "about the company",
-        "about us",
-        "company",
-    ]
     for s in sections:
-        h = (s.heading or "").lower()
-        if any(k in h for k in keys):
+        if s.heading and _ABOUT_RE.search(s.heading):
             return (s.text, s.html)
     return (None, None)
 
 
 # -------- List extraction and section classification --------
 
-_RESP_KEYS = [
+_RESP_KEYS = (
     "responsibilities",
     "what you'll do",
     "what you will do",
     "duties",
     "role",
     "what you do",
-]
+)
 
-_REQ_KEYS = [
+_REQ_KEYS = (
     "requirements",
     "qualifications",
     "what we're looking for",
@@ -261,41 +510,62 @@ _REQ_KEYS = [
     "you have",
     "must have",
     "nice to have",
-]
+)
 
-_BEN_KEYS = [
+_BEN_KEYS = (
     "benefits",
     "perks",
     "compensation and benefits",
-]
+)
+
+
+_SECTION_KEYS = (
+    ("responsibilities", _RESP_KEYS),
+    ("requirements", _REQ_KEYS),
+    ("benefits", _BEN_KEYS),
+)
+
+# One lookahead alternation with a named group per kind; overlapping keys are
+# all reported so the kind precedence above still applies.
+_SECTION_RE = re.compile(
+    "(?="
+    + "|".join(f"(?P<{kind}>" + "|".join(map(re.escape, keys)) + ")" for kind, keys in _SECTION_KEYS)
+    + ")"
+)
+
+
+_SECTION_AC = (
+    _build_automaton({k: kind for kind, keys in _SECTION_KEYS for k in keys})
+    if ahocorasick is not None
+    else None
+)
 
 
 def classify_section(heading: str) -> str | None:
     h = (heading or "").strip().lower()
     if not h:
         return None
-    if any(k in h for k in _RESP_KEYS):
-        return "responsibilities"
-    if any(k in h for k in _REQ_KEYS):
-        return "requirements"
-    if any(k in h for k in _BEN_KEYS):
-        return "benefits"
+    if _SECTION_AC is not None:
+        found = set()
+        for _end, (_length, kind) in _SECTION_AC.iter(h):
+            if kind == "responsibilities":
+                return kind
+            found.add(kind)
+    else:
+        found = {m.lastgroup for m in _SECTION_RE.finditer(h)}
+    for kind, _keys in _SECTION_KEYS:
+        if kind in found:
+            return kind
     return None
 
 
+@_content_cached()
 def extract_list_items_from_html(html: str) -> list[str]:
-    items: list[str] = []
-    soup = BeautifulSoup(html or "", "html.parser")
-    for li in soup.select("li"):
-        t = normalize_text(li.get_text(" "))
-        if t:
-            items.append(t)
+    # Read-only extraction: walk the lxml tree directly, no BeautifulSoup objects
+    if not html or not html.strip():
+        return []
+    root = lxml_html.fragment_fromstring(html, create_parent="div")
+    texts = (normalize_text(" ".join(li.itertext())) for li in root.iter("li"))
+    items = [t for t in texts if t]
     # de-dup while preserving order
-    seen = set()
-    out: list[str] = []
-    for it in items:
-        if it in seen:
-            continue
-        seen.add(it)
-        out.append(it)
-    return out
+    return list(dict.fromkeys(items))
@@ -1,9 +1,14 @@
 # src/jobboard_mcp/server.py
 import json
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional
 import importlib
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup
+    orjson = None
+
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.types import (
@@ -23,6 +28,13 @@ from .resources.jobs import list_job_resources
 from .tools.jobs import JobService
 
 
+def _dump(obj: Any, indent: bool = False) -> str:
+    """Serialize a response payload, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
 class JobBoardServer:
     def __init__(self):
         self.app = Server("jobboard-mcp")
@@ -50,7 +62,7 @@ class JobBoardServer:
         async def read_resource(req: ReadResourceRequest) -> ReadResourceResult:
             if not self.settings.features.jobs or self.job_service is None:
                 return ReadResourceResult(
-                    contents=[TextContent(type="text", text=json.dumps({"error": "jobs feature disabled"}))]
+                    contents=[TextContent(type="text", text=_dump({"error": "jobs feature disabled"}))]
                 )
 
             uri = req.uri
@@ -64,7 +76,7 @@ class JobBoardServer:
             src = mapping.get(uri)
             if not src:
                 return ReadResourceResult(
-                    contents=[TextContent(type="text", text=json.dumps({"error": f"Unknown resource: {uri}" }))]
+                    contents=[TextContent(type="text", text=_dump({"error": f"Unknown resource: {uri}" }))]
                 )
 
             # Dispatch to search with a single source
@@ -74,8 +86,8 @@ class JobBoardServer:
                 location="United States",
                 remote_only=False,
             )
-            data = [j.model_dump() for j in jobs]
-            return ReadResourceResult(contents=[TextContent(type="text", text=json.dumps(data, indent=2))])
+            data = [j.to_dict() for j in jobs]
+            return ReadResourceResult(contents=[TextContent(type="text", text=_dump(data, indent=True))])
 
         @app.list_tools()
         async def list_tools() -> ListToolsResult:
@@ -90,7 +102,7 @@ class JobBoardServer:
             if req.name in {"search_jobs", "get_job_stats"}:
                 if not self.settings.features.jobs or self.job_service is None:
                     return CallToolResult(
-                        content=[TextContent(type="text", text=json.dumps({"error": "jobs feature disabled"}))]
+                        content=[TextContent(type="text", text=_dump({"error": "jobs feature disabled"}))]
                     )
 
                 try:
@@ -108,36 +120,36 @@ class JobBoardServer:
                             remote_only=remote_only,
                         )
 
+                        # Built once; already JSON-ready, so _dump does no per-field work
+                        jobs_data = [j.to_dict() for j in jobs]
                         return CallToolResult(
                             content=[
                                 TextContent(
                                     type="text",
-                                    text=json.dumps(
+                                    text=_dump(
                                         {
-                                            "total_jobs": len(jobs),
+                                            "total_jobs": len(jobs_data),
                                             "sources_searched": sources,
                                             "keywords": keywords or [],
                                             "remote_only": remote_only,
-                                            "jobs": [j.model_dump() for j in jobs],
+                                            "jobs": jobs_data,
                                         },
-                                        indent=2,
+                                        indent=True,
                                     ),
                                 )
                             ]
                         )
                     else:
-                        # NOTE: Your JobService does not define yc/hn/tc/li attributes.
-                        # Consider reworking this to inspect JobService._instances or add aliases.
-                        stats = {"note": "get_job_stats not yet implemented against JobService caches"}
+                        stats = self.job_service.job_stats(full=bool(args.get("full", False)))
                         return CallToolResult(
-                            content=[TextContent(type="text", text=json.dumps(stats, indent=2))]
+                            content=[TextContent(type="text", text=_dump(stats, indent=True))]
                         )
                 except Exception as e:
                     self.log.exception("Tool error")
-                    return CallToolResult(content=[TextContent(type="text", text=json.dumps({"error": str(e)}) )])
+                    return CallToolResult(content=[TextContent(type="text", text=_dump({"error": str(e)}))])
 
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": f"Unknown tool {req.name}"}))]
+                content=[TextContent(type="text", text=_dump({"error": f"Unknown tool {req.name}"}))]
             )
 
     async def run_stdio(self):
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+import copy
+import logging
+import os
+import time
+from collections import OrderedDict
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from ..models.job import JobPosting
-from bs4 import BeautifulSoup  # type: ignore
+from bs4 import BeautifulSoup, Tag  # type: ignore
 from ..parsing import (
     ParserRegistry,
     YcJobParser,
@@ -15,6 +23,7 @@ from ..parsing import (
     GenericHtmlParser,
     HubOrFormParser,
 )
+from ..parsing.utils import SOUP_FEATURES, cache_stats as parsing_cache_stats
 from ..crawlers.base import BaseCrawler
 from ..crawlers.ycombinator import YCombinatorCrawler
 from ..crawlers.hackernews import HackerNewsCrawler
@@ -22,6 +31,116 @@ from ..crawlers.workatastartup import WorkAtStartupCrawler
 from ..crawlers.yc_companies import YCCompaniesCrawler
 
 
+# Non-content elements removed before detail extraction
+_STRIP_TAGS = ["script", "style", "nav", "header", "footer"]
+
+logger = logging.getLogger(__name__)
+
+# Source crawls allowed in flight at once, per JobService
+SOURCE_CONCURRENCY = 4
+
+# Descriptions longer than this are truncated (with a trailing "...")
+DESCRIPTION_MAX_CHARS = 5000
+
+# A description candidate at least this long is taken without trying the rest
+DESCRIPTION_MIN_CHARS = 200
+
+# Parsed postings kept by JobService.parse_job_url (for cache_ttl_seconds each)
+URL_CACHE_MAX = 1024
+
+
+# Selector priority per field for _extract_job_details_from_html, as
+# (kind, arg) pairs equivalent to the CSS selectors noted alongside
+_FIELD_SELECTORS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "title": (
+        ("tag", "h1"),                   # h1
+        ("testid", "job-title"),         # [data-testid="job-title"]
+        ("class", "job-title"),          # .job-title
+        ("class_sub", "title"),          # [class*="title"]
+        ("tag", "title"),                # title
+    ),
+    "company": (
+        ("testid", "company-name"),
+        ("class", "company-name"),
+        ("class_sub", "company"),
+        ("has_attr", "data-company"),
+    ),
+    "location": (
+        ("testid", "job-location"),
+        ("class", "job-location"),
+        ("class_sub", "location"),
+        ("has_attr", "data-location"),
+    ),
+    "salary": (
+        ("testid", "job-salary"),
+        ("class", "job-salary"),
+        ("class_sub", "salary"),
+        ("has_attr", "data-salary"),
+    ),
+    "description": (
+        ("testid", "job-description"),
+        ("class", "job-description"),
+        ("class_sub", "description"),
+        ("class_sub", "job-posting"),
+        ("tag", "main"),
+        ("tag", "article"),
+        ("class", "content"),
+    ),
+}
+
+
+def _capped_text(element: Tag, limit: int) -> str:
+    """element.get_text(separator=" ", strip=True)[:limit] without building the full text."""
+    parts: List[str] = []
+    total = -1  # no separator before the first part
+    for text in element.stripped_strings:
+        parts.append(text)
+        total += len(text) + 1
+        if total >= limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def _matches(el: Tag, kind: str, arg: str, classes: List[str], class_attr: str) -> bool:
+    if kind == "tag":
+        return el.name == arg
+    if kind == "testid":
+        return el.get("data-testid") == arg
+    if kind == "class":
+        return arg in classes
+    if kind == "class_sub":
+        return arg in class_attr
+    return el.has_attr(arg)
+
+
+def _first_matches(soup: BeautifulSoup) -> Dict[str, List[Optional[Tag]]]:
+    """First element in document order for every selector in _FIELD_SELECTORS.
+
+    Same result as select_one() per selector, but the tree is walked once
+    and the walk stops as soon as every selector has its match.
+    """
+    found: Dict[str, List[Optional[Tag]]] = {
+        field: [None] * len(sels) for field, sels in _FIELD_SELECTORS.items()
+    }
+    pending = sum(len(sels) for sels in _FIELD_SELECTORS.values())
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        classes = el.get("class") or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        class_attr = " ".join(classes)
+        for field, sels in _FIELD_SELECTORS.items():
+            slots = found[field]
+            for i, (kind, arg) in enumerate(sels):
+                if slots[i] is None and _matches(el, kind, arg, classes, class_attr):
+                    slots[i] = el
+                    pending -= 1
+        if not pending:
+            break
+    return found
+
+
 class JobService:
     """
     Facade for aggregating jobs from multiple crawlers.
@@ -40,15 +159,50 @@ class JobService:
         }
         self.cache_ttl_seconds = cache_ttl_seconds
         self._instances: Dict[str, BaseCrawler] = {}
-        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
-        self._global_sem = asyncio.Semaphore(10)
+        # Caps source crawls in flight across all concurrent searches, so
+        # overlapping calls can't swamp the connector pools or the providers
+        self._source_sem = asyncio.Semaphore(SOURCE_CONCURRENCY)
+        # HTML parsing is CPU-bound; run it here so it neither blocks the event
+        # loop nor serializes concurrent parse_job_url calls (lxml drops the GIL)
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="job-parse"
+        )
+        self._shared_crawler: Optional[BaseCrawler] = None
+        # url -> (stored at, monotonic clock; parsed posting), oldest first
+        self._url_cache: "OrderedDict[str, Tuple[float, JobPosting]]" = OrderedDict()
+        # Parsers are stateless, so one registry (and its parse cache) serves every call
+        self._parser_registry = ParserRegistry()
+        yc, ashby, lever, greenhouse = YcJobParser(), AshbyJobParser(), LeverJobParser(), GreenhouseJobParser()
+        for parser in (
+            yc,
+            ashby,
+            lever,
+            greenhouse,
+            HubOrFormParser(),
+            GenericHtmlParser(),  # keep generic last so specific parsers win
+        ):
+            self._parser_registry.register(parser)
+        # Job detail pages on known ATS hosts skip detection entirely; board
+        # index pages there still go through it (they may be hubs)
+        self._parser_registry.route(r"ycombinator\.com/companies/[^/]+/jobs/[^/]+", yc)
+        self._parser_registry.route(r"jobs\.ashbyhq\.com/[^/]+/[0-9a-f-]{36}", ashby)
+        self._parser_registry.route(r"jobs\.lever\.co/[^/]+/[0-9a-f-]{36}", lever)
+        self._parser_registry.route(r"(job-)?boards\.greenhouse\.io/[^/]+/jobs/\d+", greenhouse)
 
     async def close(self) -> None:
-        """Close all crawler sessions."""
+        """Close all crawler sessions and the parse pool."""
+        crawlers = list(self._crawlers.values())
+        if self._shared_crawler is not None:
+            crawlers.append(self._shared_crawler)
         await asyncio.gather(
-            *(c.close_session() for c in self._crawlers.values()),
+            *(c.close_session() for c in crawlers),
             return_exceptions=True,
         )
+        self._parse_pool.shutdown(wait=False)
+
+    def parse_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the memoized parsing helpers (sanitize, normalize, tech stack, lists)."""
+        return parsing_cache_stats()
 
     async def __aenter__(self):
         return self
@@ -65,8 +219,12 @@ class JobService:
         location: Optional[str] = None,
         max_pages: int = 2,
         per_source_limit: int = 100,
+        max_results: Optional[int] = None,
     ) -> Dict[str, object]:
+        # One wall-clock read; elapsed time comes from the monotonic clock so
+        # clock adjustments mid-search can't skew it
         started_at = datetime.now(timezone.utc)
+        started_mono = time.monotonic()
         jobs: List[JobPosting] = []
         errors: Dict[str, str] = {}
         counts: Dict[str, int] = {}
@@ -76,7 +234,15 @@ class JobService:
             if s not in self._crawlers:
                 errors[s] = "unknown source"
 
+        # Casefolded once here rather than per job inside run_source
+        loc_lower = (location or "").strip().casefold()
+
+        # Crawls are bounded service-wide (see _source_sem)
         async def run_source(key: str) -> List[JobPosting]:
+            async with self._source_sem:
+                return await _run_source(key)
+
+        async def _run_source(key: str) -> List[JobPosting]:
             try:
                 if key == "ycombinator":
                     res = await self.yc.crawl(keywords=keywords, max_pages=max_pages)
@@ -95,30 +261,44 @@ class JobService:
                 else:
                     res = await self._crawlers[key].crawl(keywords=keywords)
 
-                out: List[JobPosting] = []
-                for j in res[:per_source_limit]:
+                def accept(j: JobPosting) -> bool:
                     if remote_only and not j.remote_ok:
-                        continue
-                    if location and location.strip():
-                        if (
-                            location.lower()
-                            not in f"{j.location} {j.description}".lower()
-                        ):
-                            continue
-                    out.append(j)
+                        return False
+                    return not loc_lower or loc_lower in j.lower_blob
+
+                # First per_source_limit matching jobs; stops filtering once full
+                out = list(islice(filter(accept, res), per_source_limit))
                 counts[key] = len(out)
                 return out
             except Exception as e:
                 errors[key] = f"{type(e).__name__}: {e}"
                 return []
 
-        results = await asyncio.gather(*(run_source(s) for s in run_sources))
-        for batch in results:
-            jobs.extend(batch)
-
-        jobs = self._dedupe_jobs(jobs)
+        tasks = [asyncio.ensure_future(run_source(s)) for s in run_sources]
+        try:
+            if max_results is None:
+                # Every source is needed anyway, so dedupe in request order:
+                # the first requested source wins a duplicate, not the fastest
+                batches = await asyncio.gather(*tasks)
+                jobs = self._dedupe_jobs(list(chain.from_iterable(batches)))
+            else:
+                # Dedupe each batch as it lands and stop early once
+                # max_results unique jobs are in hand
+                seen: Dict[Tuple[str, ...], JobPosting] = {}
+                for fut in asyncio.as_completed(tasks):
+                    for j in await fut:
+                        seen.setdefault(j.canonical_key, j)
+                    if len(seen) >= max_results:
+                        break
+                jobs = list(seen.values())[:max_results]
+        finally:
+            pending = [t for t in tasks if not t.done()]
+            for t in pending:
+                t.cancel()
+            # Let cancelled sources unwind before returning
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        completed_at = datetime.now(timezone.utc)
+        completed_at = started_at + timedelta(seconds=time.monotonic() - started_mono)
         metadata = {
             "countsPerSource": counts,
             "errors": errors or None,
@@ -128,25 +308,13 @@ class JobService:
         }
         return {"jobs": jobs, "metadata": metadata}
 
-    def _canonical_key(self, job: JobPosting) -> str:
-        """Generate a canonical key for deduplication."""
-        # Use URL as primary key if available
-        if job.url:
-            return job.url
-
-        # Fallback to title + company combination
-        return f"{job.title}@{job.company}"
-
     def _dedupe_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
-        seen = set()
-        out: List[JobPosting] = []
+        # First occurrence wins; dicts keep insertion order. The key
+        # (canonical URL, else (title, company)) is precomputed on JobPosting.
+        seen: Dict[Tuple[str, ...], JobPosting] = {}
         for j in jobs:
-            key = self._canonical_key(j)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(j)
-        return out
+            seen.setdefault(j.canonical_key, j)
+        return list(seen.values())
 
     async def parse_job_url(self, url: str) -> JobPosting:
         """
@@ -158,90 +326,94 @@ class JobService:
         Returns:
             JobPosting with extracted details
         """
-        from urllib.parse import urlparse
+        now = time.monotonic()
+        entry = self._url_cache.get(url)
+        if entry is not None and now - entry[0] < self.cache_ttl_seconds:
+            # copy so callers can't mutate the cached posting
+            return copy.deepcopy(entry[1])
 
         # Check if this is a YC company job URL and prefer our YC parser path
         use_yc_parser = ('ycombinator.com/companies/' in url and '/jobs/' in url)
 
-        # Create a temporary crawler instance for fetching the page
-        crawler = BaseCrawler()
-        await crawler._ensure_session()
+        # One long-lived crawler so page fetches reuse its pooled keep-alive connections
+        if self._shared_crawler is None:
+            self._shared_crawler = BaseCrawler()
+        crawler = self._shared_crawler
+
+        # Fetch the HTML content
+        html_content = await crawler.get_text(url)
+        if not html_content:
+            # Create a basic job posting when content cannot be fetched
+            parsed = urlparse(url)
+            host = parsed.hostname or "unknown"
+            job_posting = JobPosting(
+                url=url,
+                source=host,
+                title=f"Job at {host}",
+                company=host,
+                location="Location Not Specified",
+                description=f"Could not fetch content from {url}",
+                salary=None,
+                remote_ok=False,
+            )
+            return job_posting
 
         try:
-            # Fetch the HTML content
-            html_content = await crawler.get_text(url)
-            if not html_content:
-                # Create a basic job posting when content cannot be fetched
-                parsed = urlparse(url)
-                host = parsed.hostname or "unknown"
-                job_posting = JobPosting(
-                    url=url,
-                    source=host,
-                    title=f"Job at {host}",
-                    company=host,
-                    location="Location Not Specified",
-                    description=f"Could not fetch content from {url}",
-                    salary=None,
-                    remote_ok=False,
-                )
-                return job_posting
-
-            # Use the parser registry for YC and Ashby (and future parsers)
-            soup = BeautifulSoup(html_content, "html.parser")
-            registry = ParserRegistry()
-            registry.register(YcJobParser())
-            registry.register(AshbyJobParser())
-            registry.register(LeverJobParser())
-            registry.register(GreenhouseJobParser())
-            registry.register(GreenhouseJobParser())
-            registry.register(HubOrFormParser())
-            registry.register(GenericHtmlParser())  # keep generic last so specific parsers win
-            try:
-                parser, det = registry.choose(url, soup)
-                parsed = parser.parse(url, soup)
+            loop = asyncio.get_running_loop()
+            parser, det, parsed = await loop.run_in_executor(
+                self._parse_pool, self._parser_registry.parse, url, html_content, SOUP_FEATURES
+            )
 
-                # Structured parse diagnostics
+            # Structured parse diagnostics (stdout belongs to the MCP stdio
+            # transport, so these go to the log, and only when DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
                 try:
-                    desc_len = len(parsed.descriptionText or "")
-                    sections_len = len(parsed.sections or [])
-                    req_len = len(parsed.requirements or [])
-                    res_len = len(parsed.responsibilities or [])
-                    ben_len = len(parsed.benefits or [])
-                    tech_len = len(parsed.techStack or [])
-                    salary_present = 1 if getattr(parsed, "salaryInfo", None) else 0
-                    links = getattr(parsed, "companyProfile", None).links if getattr(parsed, "companyProfile", None) else {}
-                    links_present = 1 if links else 0
-                    warnings_len = len(parsed.warnings or [])
-                    print(
-                        f"[MCP-Parse] parser={parsed.parser} detect.score={det.score} detect.reason={det.reason} "
-                        f"desc.len={desc_len} sections={sections_len} req={req_len} res={res_len} ben={ben_len} "
-                        f"tech={tech_len} salary={salary_present} links={links_present} warnings={warnings_len}",
-                        flush=True,
+                    profile = getattr(parsed, "companyProfile", None)
+                    logger.debug(
+                        "[MCP-Parse] parser=%s detect.score=%s detect.reason=%s desc.len=%d "
+                        "sections=%d req=%d res=%d ben=%d tech=%d salary=%d links=%d warnings=%d",
+                        parsed.parser,
+                        det.score,
+                        det.reason,
+                        len(parsed.descriptionText or ""),
+                        len(parsed.sections or []),
+                        len(parsed.requirements or []),
+                        len(parsed.responsibilities or []),
+                        len(parsed.benefits or []),
+                        len(parsed.techStack or []),
+                        1 if getattr(parsed, "salaryInfo", None) else 0,
+                        1 if profile is not None and profile.links else 0,
+                        len(parsed.warnings or []),
                     )
                 except Exception:
                     # Never break parsing on logging
                     pass
-                description = parsed.descriptionText or parsed.descriptionHtml or ""
-                if description and len(description) > 5000:
-                    description = description[:5000] + "..."
-                job_posting = JobPosting(
-                    url=url,
-                    source=parsed.source or ("Y Combinator" if use_yc_parser else ""),
-                    title=parsed.title or "Job Posting",
-                    company=parsed.company or "Unknown",
-                    location=parsed.location or "Unknown",
-                    description=description or "",
-                    salary=None,
-                    remote_ok=(parsed.location or "").lower().find("remote") >= 0,
-                )
-                return job_posting
-            except Exception:
-                # Fallback: old generic extractor
-                job_posting = self._extract_job_details_from_html(html_content, url)
-                return job_posting
+            description = parsed.descriptionText or parsed.descriptionHtml or ""
+            if len(description) > DESCRIPTION_MAX_CHARS:
+                description = f"{description[:DESCRIPTION_MAX_CHARS]}..."
+            job_posting = JobPosting(
+                url=url,
+                source=parsed.source or ("Y Combinator" if use_yc_parser else ""),
+                title=parsed.title or "Job Posting",
+                company=parsed.company or "Unknown",
+                location=parsed.location or "Unknown",
+                description=description or "",
+                salary=None,
+                remote_ok="remote" in (parsed.location or "").lower(),
+            )
+        except Exception:
+            # Fallback: old generic extractor
+            job_posting = await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool, self._extract_job_details_from_html, html_content, url
+            )
+        self._remember_url(url, now, job_posting)
+        return copy.deepcopy(job_posting)
 
-        finally:
-            await crawler.close_session()
+    def _remember_url(self, url: str, now: float, job: JobPosting) -> None:
+        self._url_cache.pop(url, None)
+        self._url_cache[url] = (now, job)
+        while len(self._url_cache) > URL_CACHE_MAX:
+            self._url_cache.popitem(last=False)
 
     def _extract_job_details_from_html(self, html_content: str, url: str) -> JobPosting:
         """
@@ -255,35 +427,32 @@ class JobService:
             JobPosting with extracted details
         """
         try:
-            from bs4 import BeautifulSoup
-            import re
-            from urllib.parse import urlparse
-
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, SOUP_FEATURES)
 
             # Extract domain for source
             parsed_url = urlparse(url)
             source = parsed_url.netloc
 
-            # Remove common navigation/script elements
-            for element in soup(["script", "style", "nav", "header", "footer"]):
-                element.decompose()
+            # Remove common navigation/script elements. extract() only unlinks the
+            # subtree; decompose() would also walk it to tear every node down,
+            # which the garbage collector does anyway once the soup is dropped.
+            for element in soup.find_all(_STRIP_TAGS):
+                element.extract()
+
+            # One walk records the first element matching each selector; the
+            # per-field priority rules below then read from that table
+            firsts = _first_matches(soup)
+
+            def first_text(field: str) -> Optional[str]:
+                for element in firsts[field]:
+                    if element is not None:
+                        text = element.get_text(strip=True)
+                        if text:
+                            return text
+                return None
 
             # Try to extract title (look for common title selectors)
-            title = None
-            title_selectors = [
-                "h1",
-                '[data-testid="job-title"]',
-                ".job-title",
-                '[class*="title"]',
-                "title",
-            ]
-
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    title = element.get_text(strip=True)
-                    break
+            title = first_text("title")
 
             # If no title found, try meta tags
             if not title:
@@ -293,69 +462,22 @@ class JobService:
                 if title_meta:
                     title = title_meta.get("content", "")
 
-            # Try to extract company name
-            company = None
-            company_selectors = [
-                '[data-testid="company-name"]',
-                ".company-name",
-                '[class*="company"]',
-                "[data-company]",
-            ]
-
-            for selector in company_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    company = element.get_text(strip=True)
-                    break
-
-            # Try to extract location
-            location = None
-            location_selectors = [
-                '[data-testid="job-location"]',
-                ".job-location",
-                '[class*="location"]',
-                "[data-location]",
-            ]
-
-            for selector in location_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    location = element.get_text(strip=True)
-                    break
-
-            # Try to extract salary
-            salary = None
-            salary_selectors = [
-                '[data-testid="job-salary"]',
-                ".job-salary",
-                '[class*="salary"]',
-                "[data-salary]",
-            ]
-
-            for selector in salary_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    salary = element.get_text(strip=True)
-                    break
-
-            # Extract description (main content)
+            company = first_text("company")
+            location = first_text("location")
+            salary = first_text("salary")
+
+            # Extract description (main content): the first container in priority
+            # order with a substantial amount of text, else the longest candidate.
+            # Broad containers (main, article) come last, so a specific hit
+            # saves extracting text from most of the page.
             description = ""
-            # Look for common job description containers
-            description_selectors = [
-                '[data-testid="job-description"]',
-                ".job-description",
-                '[class*="description"]',
-                '[class*="job-posting"]',
-                "main",
-                "article",
-                ".content",
-            ]
-
-            for selector in description_selectors:
-                element = soup.select_one(selector)
-                if element:
+            for element in firsts["description"]:
+                if element is not None:
                     # Get text content and clean it up
-                    desc_text = element.get_text(separator=" ", strip=True)
+                    desc_text = _capped_text(element, DESCRIPTION_MAX_CHARS + 1)
+                    if len(desc_text) >= DESCRIPTION_MIN_CHARS:
+                        description = desc_text
+                        break
                     if len(desc_text) > len(description):
                         description = desc_text
 
@@ -363,11 +485,11 @@ class JobService:
             if not description:
                 body = soup.find("body")
                 if body:
-                    description = body.get_text(separator=" ", strip=True)
+                    description = _capped_text(body, DESCRIPTION_MAX_CHARS + 1)
 
             # Limit description length to prevent oversized responses
-            if len(description) > 5000:
-                description = description[:5000] + "..."
+            if len(description) > DESCRIPTION_MAX_CHARS:
+                description = f"{description[:DESCRIPTION_MAX_CHARS]}..."
 
             # Create job posting object
             job_posting = JobPosting(
@@ -378,19 +500,14 @@ class JobService:
                 location=location or "Location Not Specified",
                 description=description or "No description available",
                 salary=salary,
-                remote_ok="remote" in (description + " " + (title or "")).lower(),
+                remote_ok="remote" in description.lower() or "remote" in (title or "").lower(),
             )
 
-            print(
-                f"[DEBUG] _extract_job_details_from_html returning: {type(job_posting)}",
-                file=sys.stderr,
-            )
+            logger.debug("_extract_job_details_from_html returning: %s", type(job_posting))
             return job_posting
 
         except Exception as e:
             # If parsing fails, create a basic job posting with URL info
-            from urllib.parse import urlparse
-
             parsed = urlparse(url)
             host = parsed.hostname or "unknown"
 
@@ -405,8 +522,5 @@ class JobService:
                 remote_ok=False,
             )
 
-            print(
-                f"[DEBUG] _extract_job_details_from_html returning fallback: {type(job_posting)}",
-                file=sys.stderr,
-            )
+            logger.debug("_extract_job_details_from_html returning fallback: %s", type(job_posting))
             return job_posting
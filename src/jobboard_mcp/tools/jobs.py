@@ -1,24 +1,37 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import inspect
+import logging
 import re
+from dataclasses import replace
 from typing import (
     Any,
+    AsyncContextManager,
     AsyncGenerator,
     AsyncIterator,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Callable,
 )
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
+import aiohttp
+
 from ..crawlers.base import BaseCrawler
 from ..crawlers.hackernews_jobs import HackerNewsJobsCrawler
 from ..crawlers.ycombinator import YCombinatorCrawler
 from ..crawlers.workatastartup import WorkAtStartupCrawler
 from ..models.job import JobPosting
+from ..parsing.utils import SOUP_FEATURES, og_meta
+
+# stdout carries the MCP stdio transport, so diagnostics go to the log
+logger = logging.getLogger(__name__)
 
 # --------------------
 # ATS handler registry
@@ -35,44 +48,53 @@ def register_ats(domain: str):
     return deco
 
 
+_SALARY_RE = re.compile(r"(Salary|Compensation|Pay|Base)\s*[:\-]\s*([^\n]+)", re.I)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+
+
+def ats_handler_for(host: str) -> Optional[Callable[[JobPosting, str], JobPosting]]:
+    """Handler registered for `host` or any parent domain of it (acme.jobs.ashbyhq.com -> jobs.ashbyhq.com)."""
+    host = host.lower()
+    while host:
+        fn = ATS_HANDLER.get(host)
+        if fn is not None:
+            return fn
+        _, _, host = host.partition(".")
+    return None
+
+
 def text_collapse(text: str) -> str:
     # Collapse excessive blank lines and normalize bullets lightly
-    text = re.sub(r"\r\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+\n", "\n", text)
+    text = text.replace("\r\n", "\n")
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    text = _TRAILING_WS_RE.sub("\n", text)
     return text.strip()
 
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, CData, NavigableString, Tag
 except ImportError:
     raise ImportError(
         "BeautifulSoup is required but not installed. Please install it using `pip install beautifulsoup4`."
     )
+try:
+    import soupsieve as sv
+except ImportError:
+    raise ImportError(
+        "soupsieve is required but not installed. Please install it using `pip install soupsieve`."
+    )
 
-# --------------------
-# ATS Parsing Functions
-# --------------------
-
-
-@register_ats("jobs.ashbyhq.com")
-@register_ats("www.ashbyhq.com")
-def parse_ashby(job: JobPosting, html: str) -> JobPosting:
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove irrelevant elements
-    for sel in [
-        "header",
-        "nav",
-        "footer",
-        "[role='navigation']",
-        "[role='banner']",
-        "[role='contentinfo']",
-    ]:
-        for el in soup.select(sel):
-            el.decompose()
 
-    selectors = [
+# CSS selectors used by the ATS parsers, compiled once at import rather than
+# re-parsed by soupsieve on every page. Page chrome is a single selector list
+# so stripping it takes one walk of the document.
+_CHROME_SELECTOR = sv.compile(
+    "header, nav, footer, [role='navigation'], [role='banner'], [role='contentinfo']"
+)
+_ASHBY_DESCRIPTION_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in (
         '[data-testid="job-posting__description"]',
         '[data-test="job-posting__description"]',
         '[data-testid="job-description"]',
@@ -86,35 +108,155 @@ def parse_ashby(job: JobPosting, html: str) -> JobPosting:
         "main",
         ".content",
         "section",
-    ]
+    )
+)
+_MAIN_SELECTOR = sv.compile("main")
+# In priority order: an outer <article>/<main> wraps the page chrome too, so
+# it is only a fallback when none of the content containers exist
+_GREENHOUSE_DESC_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in ("#content", ".content", ".opening .content", ".app-content", "article", "main")
+)
+_H1_SELECTOR = sv.compile("h1")
+_YC_COMPANY_SELECTOR = sv.compile("[data-testid='company-name'], .company-name, h2, .company")
+_YC_LOCATION_SELECTOR = sv.compile("[data-testid='job-location'], .job-location, [class*='location']")
+_YC_SALARY_SELECTOR = sv.compile("[data-testid='job-salary'], .job-salary, [class*='salary']")
+_YC_DESCRIPTION_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in (
+        '[data-testid="job-description"]',
+        ".job-description",
+        '[class*="description"]',
+        '[class*="job-posting"]',
+        "main",
+        "article",
+        ".content",
+    )
+)
 
-    node = None
+# Generic detail-page fallback (_extract_job_details_from_html), per field in priority order
+_DETAIL_TITLE_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in ("h1", '[data-testid="job-title"]', ".job-title", '[class*="title"]', "title")
+)
+_DETAIL_COMPANY_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in ('[data-testid="company-name"]', ".company-name", '[class*="company"]', "[data-company]")
+)
+_DETAIL_LOCATION_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in ('[data-testid="job-location"]', ".job-location", '[class*="location"]', "[data-location]")
+)
+_DETAIL_SALARY_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in ('[data-testid="job-salary"]', ".job-salary", '[class*="salary"]', "[data-salary]")
+)
+_DETAIL_DESCRIPTION_SELECTORS = tuple(
+    sv.compile(sel)
+    for sel in (
+        '[data-testid="job-description"]',
+        ".job-description",
+        '[class*="description"]',
+        '[class*="job-posting"]',
+        "main",
+        "article",
+        ".content",
+    )
+)
+
+
+def _first_text(selectors, soup) -> Optional[str]:
+    """Stripped text of the first selector (in priority order) whose match has any."""
     for sel in selectors:
-        cand = soup.select_one(sel)
+        element = sel.select_one(soup)
+        if element:
+            text = element.get_text(strip=True)
+            if text:
+                return text
+    return None
+
+# --------------------
+# ATS Parsing Functions
+# --------------------
+
+_BLOCK_TAGS = frozenset(("div", "section", "article"))
+_CHROME_CLASS_HINTS = ("header", "nav", "footer", "sidebar", "apply", "application")
+# What get_text() counts for ordinary tags: no comments, scripts or styles
+_TEXT_STRING_TYPES = frozenset((NavigableString, CData))
+
+
+def _biggest_text_block(root):
+    """Largest div/section/article under `root` with over 400 chars of text.
+
+    Text length is len(el.get_text(" ", strip=True)), accumulated bottom-up
+    in a single post-order walk so each string is read once rather than once
+    per enclosing container. Chrome-looking containers are not candidates
+    but still count toward their ancestors; ties go to the earliest one.
+    """
+    best = None  # (length, pre-order index, element)
+    order = 0
+    # Frames: [tag, children iterator, pre-order index, stripped chars, stripped strings]
+    stack = [[root, iter(root.contents), order, 0, 0]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
+        if child is not None:
+            if isinstance(child, Tag):
+                order += 1
+                stack.append([child, iter(child.contents), order, 0, 0])
+            elif type(child) in _TEXT_STRING_TYPES:
+                stripped = child.strip()
+                if stripped:
+                    frame[3] += len(stripped)
+                    frame[4] += 1
+            continue
+        stack.pop()
+        el, _, index, chars, count = frame
+        if stack:
+            stack[-1][3] += chars
+            stack[-1][4] += count
+        if el is root or el.name not in _BLOCK_TAGS:
+            continue
+        classes = " ".join(el.get("class", [])).lower()
+        if any(c in classes for c in _CHROME_CLASS_HINTS):
+            continue
+        if el.interesting_string_types == _TEXT_STRING_TYPES:
+            # the joined text has one separator between consecutive strings
+            length = chars + count - 1 if count else 0
+        else:
+            length = len(el.get_text(" ", strip=True))
+        if length > 400 and (best is None or (length, -index) > (best[0], -best[1])):
+            best = (length, index, el)
+    return best[2] if best else None
+
+
+def _salary_haystack(job: JobPosting, soup) -> str:
+    """Text to scan for salary/remote hints: the description once extracted,
+    the whole page only when there is none (saves a second full serialization)."""
+    return job.description or soup.get_text(" ", strip=True)
+
+
+@register_ats("jobs.ashbyhq.com")
+@register_ats("www.ashbyhq.com")
+def parse_ashby(job: JobPosting, html: str) -> JobPosting:
+    soup = BeautifulSoup(html, SOUP_FEATURES)
+
+    # Remove irrelevant elements
+    for el in _CHROME_SELECTOR.select(soup):
+        # matches nested in an earlier match went down with it
+        if not el.decomposed:
+            el.decompose()
+
+    node = None
+    for sel in _ASHBY_DESCRIPTION_SELECTORS:
+        cand = sel.select_one(soup)
         if cand and cand.get_text(strip=True):
             node = cand
             break
 
-    def biggest_text_block(root):
-        candidates = []
-        for el in root.find_all(["div", "section", "article"]):
-            classes = " ".join(el.get("class", [])).lower()
-            if any(
-                c in classes
-                for c in ["header", "nav", "footer", "sidebar", "apply", "application"]
-            ):
-                continue
-            text = el.get_text(" ", strip=True)
-            if text and len(text) > 400:
-                candidates.append((len(text), el))
-        if not candidates:
-            return None
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        return candidates[0][1]
-
     if not node:
-        root = soup.select_one("main") or soup
-        node = biggest_text_block(root) or biggest_text_block(soup)
+        root = _MAIN_SELECTOR.select_one(soup) or soup
+        node = _biggest_text_block(root) or _biggest_text_block(soup)
 
     if node:
         for bad in node.find_all(["script", "style", "noscript"]):
@@ -123,8 +265,8 @@ def parse_ashby(job: JobPosting, html: str) -> JobPosting:
         if text:
             job.description = text_collapse(text)
 
-    blob = soup.get_text(" ", strip=True)
-    m = re.search(r"(Salary|Compensation|Pay|Base)\s*[:\-]\s*([^\n]+)", blob, re.I)
+    blob = _salary_haystack(job, soup)
+    m = _SALARY_RE.search(blob)
     if m and not job.salary:
         job.salary = m.group(2).strip()
     job.remote_ok = job.remote_ok or ("remote" in blob.lower())
@@ -134,20 +276,15 @@ def parse_ashby(job: JobPosting, html: str) -> JobPosting:
 
 @register_ats("boards.greenhouse.io")
 def parse_greenhouse(job: JobPosting, html: str) -> JobPosting:
-    soup = BeautifulSoup(html, "html.parser")
-    node = (
-        soup.select_one("#content")
-        or soup.select_one(".content")
-        or soup.select_one(".opening .content")
-        or soup.select_one(".app-content")
-        or soup.find("article")
-        or soup.find("main")
+    soup = BeautifulSoup(html, SOUP_FEATURES)
+    node = next(
+        (el for el in (sel.select_one(soup) for sel in _GREENHOUSE_DESC_SELECTORS) if el), None
     )
     if node:
         job.description = text_collapse(node.get_text("\n", strip=True))
-    blob = soup.get_text(" ", strip=True)
+    blob = _salary_haystack(job, soup)
     job.remote_ok = job.remote_ok or ("remote" in blob.lower())
-    m = re.search(r"(Salary|Compensation|Pay|Base)\s*[:\-]\s*([^\n]+)", blob, re.I)
+    m = _SALARY_RE.search(blob)
     if m and not job.salary:
         job.salary = m.group(2).strip()
     return job
@@ -158,67 +295,43 @@ def parse_ycombinator(job: JobPosting, html: str) -> JobPosting:
     """
     Parse Y Combinator job posting pages.
     """
-    import sys
-
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, SOUP_FEATURES)
 
     # Remove irrelevant elements
-    for sel in [
-        "header",
-        "nav",
-        "footer",
-        "[role='navigation']",
-        "[role='banner']",
-        "[role='contentinfo']",
-    ]:
-        for el in soup.select(sel):
+    for el in _CHROME_SELECTOR.select(soup):
+        # matches nested in an earlier match went down with it
+        if not el.decomposed:
             el.decompose()
 
     # Extract job title (usually in an h1)
-    title_element = soup.select_one("h1")
+    title_element = _H1_SELECTOR.select_one(soup)
     if title_element:
         job.title = title_element.get_text(strip=True)
 
     # Extract company name (usually in a heading or div with company info)
-    company_elements = soup.select(
-        "[data-testid='company-name'], .company-name, h2, .company"
-    )
+    company_elements = _YC_COMPANY_SELECTOR.select(soup)
     for el in company_elements:
         if el and el.get_text(strip=True):
             job.company = el.get_text(strip=True)
             break
 
     # Extract location
-    location_elements = soup.select(
-        "[data-testid='job-location'], .job-location, [class*='location']"
-    )
+    location_elements = _YC_LOCATION_SELECTOR.select(soup)
     for el in location_elements:
         if el and el.get_text(strip=True):
             job.location = el.get_text(strip=True)
             break
 
     # Extract salary
-    salary_elements = soup.select(
-        "[data-testid='job-salary'], .job-salary, [class*='salary']"
-    )
+    salary_elements = _YC_SALARY_SELECTOR.select(soup)
     for el in salary_elements:
         if el and el.get_text(strip=True):
             job.salary = el.get_text(strip=True)
             break
 
     # Extract job description (main content)
-    description_selectors = [
-        '[data-testid="job-description"]',
-        ".job-description",
-        '[class*="description"]',
-        '[class*="job-posting"]',
-        "main",
-        "article",
-        ".content",
-    ]
-
-    for selector in description_selectors:
-        element = soup.select_one(selector)
+    for selector in _YC_DESCRIPTION_SELECTORS:
+        element = selector.select_one(soup)
         if element:
             # Get text content and clean it up
             desc_text = element.get_text(separator=" ", strip=True)
@@ -245,10 +358,71 @@ def parse_ycombinator(job: JobPosting, html: str) -> JobPosting:
 
 # Additional ATS parsers (e.g., Lever, WorkAtStartup, etc.) can be added here...
 
+# Placeholder values JobPosting and the parsers use for unknown fields
+_UNSET_LOCATIONS = frozenset({"", "Unknown", "Location Not Specified"})
+_UNSET_COMPANIES = frozenset({"", "Unknown", "Unknown Company"})
+
+
+class _TagMergingDeduper:
+    """Incremental form of JobService._dedupe_jobs_merge_tags.
+
+    Batches may be added as they arrive; the first posting seen for a key is
+    kept and later duplicates only contribute what it lacks. Postings come
+    straight from the crawler caches, so a merge goes into a copy and the
+    cached objects are never modified.
+    """
+
+    __slots__ = ("_index", "_out", "_merged")
+
+    def __init__(self) -> None:
+        self._index: Dict[Tuple[str, ...], int] = {}
+        self._out: List[JobPosting] = []
+        # Ordered tag union per output index, only for postings that actually repeat
+        self._merged: Dict[int, Dict[str, None]] = {}
+
+    def add(self, jobs: Iterable[JobPosting]) -> None:
+        index, out, merged = self._index, self._out, self._merged
+        for job in jobs:
+            # Canonical URL (title/company without one), precomputed on the model
+            idx = index.setdefault(job.canonical_key, len(out))
+            if idx == len(out):
+                out.append(job)
+                continue
+            first = out[idx]
+            acc = merged.get(idx)
+            if acc is None:
+                # First duplicate for this key: swap in a copy to merge into
+                first = out[idx] = replace(first)
+                acc = merged[idx] = dict.fromkeys(first.tags or [])
+            acc.update(dict.fromkeys(job.tags or []))
+            if job.remote_ok:
+                first.remote_ok = True
+            if first.location in _UNSET_LOCATIONS and job.location not in _UNSET_LOCATIONS:
+                first.location = job.location
+            if first.company in _UNSET_COMPANIES and job.company not in _UNSET_COMPANIES:
+                first.company = job.company
+
+    def result(self) -> List[JobPosting]:
+        for idx, acc in self._merged.items():
+            self._out[idx].tags = list(acc)
+        self._merged.clear()
+        return self._out
+
+
 # --------------------
 # Job Service Class
 # --------------------
 
+# Concurrent detail-page fetches allowed against any one host during enrichment.
+# Never above the connector's own per-host cap: a fetch queued inside the
+# connector would sit on a _global_sem slot while it waits.
+PER_HOST_FETCHES = BaseCrawler.CONNECTION_LIMIT_PER_HOST
+
+# Pages at least this large are first tried via their Open Graph meta tags;
+# an og:description this long is used as is, skipping the DOM parse
+LARGE_PAGE_CHARS = 500_000
+OG_DESCRIPTION_MIN_CHARS = 200
+
 
 class JobService:
     SOURCE_MAP: Dict[str, type] = {
@@ -259,9 +433,26 @@ class JobService:
 
     def __init__(self, cache_ttl_seconds: int = 600):
         self.cache_ttl_seconds = cache_ttl_seconds
-        self._instances: Dict[str, BaseCrawler] = {}
+        # Every source's crawler up front: cheap (no sessions yet) and no
+        # lazy-creation race between concurrent searches
+        self._instances: Dict[str, BaseCrawler] = {
+            name: cls() for name, cls in self.SOURCE_MAP.items()
+        }
+        # Sources whose crawl() takes per_page_limit, read off the signatures
+        # once here instead of special-casing crawlers by name per call
+        self._takes_page_limit: Set[str] = {
+            name
+            for name, crawler in self._instances.items()
+            if "per_page_limit" in inspect.signature(crawler.crawl).parameters
+        }
+        self._initialized: Set[str] = set()
+        # One session (and connection pool) for all crawlers, reused across
+        # searches so keep-alive connections and DNS lookups carry over between
+        # sources; created on first use (needs a loop)
+        self._session: Optional[aiohttp.ClientSession] = None
         self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
         self._global_sem = asyncio.Semaphore(10)
+        self._enrich_crawler: Optional[BaseCrawler] = None
 
     async def search_jobs_stream(
         self,
@@ -274,13 +465,21 @@ class JobService:
         tags: Optional[List[str]] = None,
         enrich: bool = True,
         enrich_limit: Optional[int] = 50,
+        include_raw_html: bool = False,
+        concurrency: Optional[int] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream job search results as events."""
+        """Stream job search results as events.
+
+        Sources are crawled concurrently, at most `concurrency` at a time when
+        given; events from one source stay in order, but different sources'
+        events interleave. Job payloads leave out raw_html (often tens of KB
+        per job) unless include_raw_html is set.
+        """
         if not sources:
             return
 
         requested_sources = [s.lower().strip() for s in sources]
-        req_tags_norm = self._normalize_tags(tags)
+        accept = self._job_filter(remote_only, location, tags)
 
         # Emit start event
         yield {
@@ -292,93 +491,95 @@ class JobService:
             "location": location,
         }
 
+        # Sources run concurrently and push their events onto one queue as
+        # they happen; None marks a finished worker
+        queue: asyncio.Queue = asyncio.Queue()
+        limit = asyncio.Semaphore(concurrency) if concurrency else contextlib.nullcontext()
+        tasks = [
+            asyncio.create_task(
+                self._run_and_emit(
+                    src, queue, limit, accept, keywords, max_pages, per_source_limit, include_raw_html
+                )
+            )
+            for src in requested_sources
+        ]
+
         total_jobs = 0
         total_pages = 0
+        running = len(tasks)
+        try:
+            while running:
+                ev = await queue.get()
+                if ev is None:
+                    running -= 1
+                    continue
+                if ev["type"] == "source_complete":
+                    total_jobs += ev["total"]
+                    total_pages += ev["pages"]
+                yield ev
+        finally:
+            # Consumer stopped early (or was cancelled): don't leave crawls running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        for src in requested_sources:
-            # Emit source start event
-            yield {"type": "source_start", "source": src}
+        # Emit complete event
+        yield {
+            "type": "complete",
+            "total_jobs": total_jobs,
+            "sources": len(requested_sources),
+            "pages": total_pages,
+        }
 
-            source_jobs = []
-            source_pages = 0
+    async def _run_and_emit(
+        self,
+        src: str,
+        queue: asyncio.Queue,
+        limit: AsyncContextManager[Any],
+        accept: Callable[[JobPosting], bool],
+        keywords: Optional[List[str]],
+        max_pages: int,
+        per_source_limit: int,
+        include_raw_html: bool,
+    ) -> None:
+        """Run one source for search_jobs_stream, pushing its events onto `queue`."""
+        try:
+            await queue.put({"type": "source_start", "source": src})
+            # Per-search limit first, so a capped search never holds global slots idle
+            async with limit, self._global_sem:
+                jobs = await self._run_source(src, keywords, max_pages, per_source_limit)
 
-            try:
-                # Run the source and get all jobs
-                jobs = await self._run_source(
-                    src, keywords, max_pages, per_source_limit
-                )
+            # Emit page start event (simplified - treating all as one page for streaming)
+            await queue.put({"type": "page_start", "source": src, "page": 1})
 
-                # Filter jobs based on criteria
-                filtered_jobs = [
-                    j
-                    for j in jobs
-                    if (not remote_only or getattr(j, "remote_ok", False))
-                    and (not location or self._location_match(j, location))
-                    and (not req_tags_norm or self._has_required_tags(j, req_tags_norm))
-                ]
-
-                # Emit page start event (simplified - treating all as one page for streaming)
-                yield {"type": "page_start", "source": src, "page": 1}
-
-                # Emit job events
-                for job in filtered_jobs:
-                    yield {
+            count = 0
+            for job in jobs:
+                if not accept(job):
+                    continue
+                data = job.fields_dict()
+                if not include_raw_html:
+                    del data["raw_html"]
+                await queue.put(
+                    {
                         "type": "job",
                         "source": src,
                         "page": 1,
                         "key": f"{src}:{job.url}",
-                        "data": {
-                            "id": job.id,
-                            "source": job.source,
-                            "url": job.url,
-                            "title": job.title,
-                            "company": job.company,
-                            "location": job.location,
-                            "description": job.description,
-                            "posted_date": job.posted_date,
-                            "salary": job.salary,
-                            "job_type": job.job_type,
-                            "remote_ok": job.remote_ok,
-                            "requirements": job.requirements,
-                            "seniority": job.seniority,
-                            "tags": job.tags,
-                            "raw_html": job.raw_html,
-                            "source_key": job.source_key,
-                        },
+                        "data": data,
                     }
-                    source_jobs.append(job)
-
-                # Emit page complete event
-                yield {
-                    "type": "page_complete",
-                    "source": src,
-                    "page": 1,
-                    "count": len(source_jobs),
-                }
-
-                source_pages = 1
-                total_jobs += len(source_jobs)
-                total_pages += source_pages
-
-                # Emit source complete event
-                yield {
-                    "type": "source_complete",
-                    "source": src,
-                    "pages": source_pages,
-                    "total": len(source_jobs),
-                }
-
-            except Exception as e:
-                # Emit error event
-                yield {"type": "error", "source": src, "page": 1, "message": str(e)}
+                )
+                count += 1
 
-        # Emit complete event
-        yield {
-            "type": "complete",
-            "total_jobs": total_jobs,
-            "sources": len(requested_sources),
-            "pages": total_pages,
-        }
+            await queue.put(
+                {"type": "page_complete", "source": src, "page": 1, "count": count}
+            )
+            await queue.put(
+                {"type": "source_complete", "source": src, "pages": 1, "total": count}
+            )
+        except Exception as e:
+            await queue.put({"type": "error", "source": src, "page": 1, "message": str(e)})
+        finally:
+            queue.put_nowait(None)
 
     async def search_jobs(
         self,
@@ -396,30 +597,37 @@ class JobService:
             return []
 
         requested_sources = [s.lower().strip() for s in sources]
-        req_tags_norm = self._normalize_tags(tags)
-
-        tasks = [
-            self._run_source(src, keywords, max_pages, per_source_limit)
-            for src in requested_sources
-        ]
-        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
-
-        jobs: List[JobPosting] = []
-        for src, res in zip(requested_sources, results_lists):
-            if isinstance(res, Exception):
-                print(f"[WARN] source {src} failed: {res}")
-                continue
+        accept = self._job_filter(remote_only, location, tags)
 
-            filtered = [
-                j
-                for j in res
-                if (not remote_only or getattr(j, "remote_ok", False))
-                and (not location or self._location_match(j, location))
-                and (not req_tags_norm or self._has_required_tags(j, req_tags_norm))
-            ]
-            jobs.extend(filtered)
+        async def run(i: int, src: str) -> Tuple[int, Any]:
+            try:
+                return i, await self._run_source(src, keywords, max_pages, per_source_limit)
+            except Exception as e:
+                return i, e
+
+        # Each source is filtered and deduped as soon as it and every source
+        # requested before it have landed, so slower crawls overlap the work
+        # while duplicates still resolve in request order
+        tasks = [asyncio.ensure_future(run(i, src)) for i, src in enumerate(requested_sources)]
+        deduper = _TagMergingDeduper()
+        landed: Dict[int, List[JobPosting]] = {}
+        next_i = 0
+        try:
+            for fut in asyncio.as_completed(tasks):
+                i, res = await fut
+                if isinstance(res, Exception):
+                    logger.warning("source %s failed: %s", requested_sources[i], res)
+                    res = []
+                landed[i] = res
+                while next_i in landed:
+                    deduper.add(filter(accept, landed.pop(next_i)))
+                    next_i += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        deduped = self._dedupe_jobs_merge_tags(jobs)
+        deduped = deduper.result()
 
         if enrich:
             subset = deduped[:enrich_limit]
@@ -427,7 +635,7 @@ class JobService:
                 enriched_subset = await self.enrich_details(subset)
                 deduped[: len(enriched_subset)] = enriched_subset
             except Exception as e:
-                print(f"[WARN] enrich failed: {e}")
+                logger.warning("enrich failed: %s", e)
 
         return deduped
 
@@ -436,43 +644,46 @@ class JobService:
             return []
         return [t.strip().lower() for t in tags if t.strip()]
 
-    def _location_match(self, job: JobPosting, want: str) -> bool:
+    def _job_filter(
+        self, remote_only: bool, location: Optional[str], tags: Optional[List[str]]
+    ) -> Callable[[JobPosting], bool]:
+        """Build the per-job search predicate, normalizing the criteria once up front."""
+        want_norm = location.strip().casefold() if location else None
+        req_tags = frozenset(self._normalize_tags(tags))
+        # Bound once so the per-job calls skip the attribute lookups
+        location_match = self._location_match
+        has_required_tags = self._has_required_tags
+
+        def accept(j: JobPosting) -> bool:
+            if remote_only and not j.remote_ok:
+                return False
+            if want_norm is not None and not location_match(j, want_norm):
+                return False
+            return not req_tags or has_required_tags(j, req_tags)
+
+        return accept
+
+    def _location_match(self, job: JobPosting, want_norm: str) -> bool:
         """
-        Check if the desired location is mentioned in the job's location,
-        title, or description.
+        Check if the desired location (already stripped and casefolded) is
+        mentioned in the job's location, title, or description.
         """
-        want_norm = want.strip().lower()
-        blob = " ".join(
-            [
-                getattr(job, "location", ""),
-                getattr(job, "title", ""),
-                getattr(job, "description", ""),
-            ]
-        ).lower()
-        return want_norm in blob
-
-    def _has_required_tags(self, job: JobPosting, required_tags: List[str]) -> bool:
-        """Check if job has all required tags"""
-        job_tags = getattr(job, "tags", [])
-        if not job_tags:
-            return False
-        job_tags = [t.strip().lower() for t in job_tags]
-        return all(tag in job_tags for tag in required_tags)
-
-    def _dedupe_jobs_merge_tags(self, jobs: List[JobPosting]) -> List[JobPosting]:
-        """Remove duplicate jobs and merge tags"""
-        seen = {}
-        for job in jobs:
-            # Use URL as primary key for deduplication
-            key = job.url
-            if key in seen:
-                # Merge tags
-                existing_tags = seen[key].tags or []
-                new_tags = job.tags or []
-                seen[key].tags = list(set(existing_tags + new_tags))
-            else:
-                seen[key] = job
-        return list(seen.values())
+        # The title is only folded when the cached blob has no match
+        return want_norm in job.lower_blob or want_norm in (job.title or "").casefold()
+
+    def _has_required_tags(self, job: JobPosting, required_tags: frozenset) -> bool:
+        """Check if job has all required tags (already normalized)"""
+        return required_tags.issubset(job.tag_set)
+
+    def _dedupe_jobs_merge_tags(self, jobs: Iterable[JobPosting]) -> List[JobPosting]:
+        """Remove duplicate jobs, merging tags, remote_ok and missing location/company.
+
+        The first posting seen for a key is kept; cached postings are never
+        modified (see _TagMergingDeduper).
+        """
+        deduper = _TagMergingDeduper()
+        deduper.add(jobs)
+        return deduper.result()
 
     async def _run_source(
         self,
@@ -485,66 +696,66 @@ class JobService:
         if source not in self.SOURCE_MAP:
             raise ValueError(f"Unknown source: {source}")
 
-        if source not in self._instances:
-            self._instances[source] = self.SOURCE_MAP[source]()
-
         crawler = self._instances[source]
+        crawler.session = self._shared_session()
 
-        # Initialize crawler if needed
-        if hasattr(crawler, "initialize"):
-            await crawler.initialize()
+        # Initialize crawler once per instance, not on every search
+        if source not in self._initialized:
+            if hasattr(crawler, "initialize"):
+                await crawler.initialize()
+            self._initialized.add(source)
 
-        # Get job listings
-        jobs = []
+        kwargs: Dict[str, Any] = {"keywords": keywords, "max_pages": max_pages}
+        if source in self._takes_page_limit:
+            kwargs["per_page_limit"] = per_source_limit
         try:
-            job_list = []
-            if source == "ycombinator":
-                # YC crawler doesn't take per_page_limit
-                job_list = await crawler.crawl(keywords=keywords, max_pages=max_pages)
-            else:
-                # Other crawlers take per_page_limit
-                job_list = await crawler.crawl(
-                    keywords=keywords,
-                    max_pages=max_pages,
-                    per_page_limit=per_source_limit,
-                )
-            jobs.extend(job_list)
+            return await crawler.crawl(**kwargs)
         except Exception as e:
-            print(f"[ERROR] Failed to fetch jobs from {source}: {e}")
+            logger.error("Failed to fetch jobs from %s: %s", source, e)
             raise
 
-        return jobs
+    def _shared_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Room for every source crawler plus enrichment at their usual caps
+            self._session = BaseCrawler.make_session(
+                BaseCrawler.CONNECTION_LIMIT * (len(self.SOURCE_MAP) + 1)
+            )
+        return self._session
 
-    async def enrich_details(self, jobs: List[JobPosting]) -> List[JobPosting]:
-        """Enrich job details by fetching and parsing job URLs"""
-        enriched_jobs = []
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        sem = self._domain_semaphores.get(host)
+        if sem is None:
+            sem = self._domain_semaphores[host] = asyncio.Semaphore(PER_HOST_FETCHES)
+        return sem
 
-        for job in jobs:
-            try:
-                # Skip if already has detailed description
-                if job.description and len(job.description) > 200:
-                    enriched_jobs.append(job)
-                    continue
+    async def _enrich_one(self, job: JobPosting) -> JobPosting:
+        try:
+            # Skip if already has detailed description
+            if job.description and len(job.description) > 200:
+                return job
 
-                # Fetch and parse job URL
+            # Fetch and parse job URL; bounded per host and overall
+            async with self._host_semaphore(job.url), self._global_sem:
                 parsed_job = await self.parse_job_url(job.url)
 
-                # Update original job with parsed details
-                if parsed_job.description:
-                    job.description = parsed_job.description
-                if parsed_job.salary:
-                    job.salary = parsed_job.salary
-                if parsed_job.location:
-                    job.location = parsed_job.location
-                if parsed_job.remote_ok is not None:
-                    job.remote_ok = parsed_job.remote_ok
-
-                enriched_jobs.append(job)
-            except Exception as e:
-                print(f"[WARN] Failed to enrich job {job.url}: {e}")
-                enriched_jobs.append(job)  # Add original job if enrichment fails
+            # Update original job with parsed details
+            if parsed_job.description:
+                job.description = parsed_job.description
+            if parsed_job.salary:
+                job.salary = parsed_job.salary
+            if parsed_job.location:
+                job.location = parsed_job.location
+            if parsed_job.remote_ok is not None:
+                job.remote_ok = parsed_job.remote_ok
+        except Exception as e:
+            logger.warning("Failed to enrich job %s: %s", job.url, e)
+        # The original job is kept (as-is) if enrichment fails
+        return job
 
-        return enriched_jobs
+    async def enrich_details(self, jobs: List[JobPosting]) -> List[JobPosting]:
+        """Enrich job details by fetching and parsing job URLs concurrently"""
+        return list(await asyncio.gather(*(self._enrich_one(job) for job in jobs)))
 
     async def parse_job_url(self, url: str) -> JobPosting:
         """
@@ -556,44 +767,46 @@ class JobService:
         Returns:
             JobPosting with extracted details
         """
-        # Create a temporary crawler instance for fetching the page
-        crawler = BaseCrawler()
-        await crawler._ensure_session()
-
-        try:
-            # Fetch the HTML content
-            html_content = await crawler.get_text(url)
-            if not html_content:
-                # Create a basic job posting when content cannot be fetched
-                parsed = urlparse(url)
-                host = parsed.hostname or "unknown"
-                job_posting = JobPosting(
-                    url=url,
-                    source=host,
-                    title=f"Job at {host}",
-                    company=host,
-                    location="Location Not Specified",
-                    description=f"Could not fetch content from {url}",
-                    salary=None,
-                    remote_ok=False,
-                )
-                return job_posting
+        # One long-lived crawler so fetches reuse its pooled keep-alive connections
+        if self._enrich_crawler is None:
+            self._enrich_crawler = BaseCrawler()
+        crawler = self._enrich_crawler
+        crawler.session = self._shared_session()
+
+        # Fetch the HTML content
+        html_content = await crawler.get_text(url)
+        if not html_content:
+            # Create a basic job posting when content cannot be fetched
+            parsed = urlparse(url)
+            host = parsed.hostname or "unknown"
+            job_posting = JobPosting(
+                url=url,
+                source=host,
+                title=f"Job at {host}",
+                company=host,
+                location="Location Not Specified",
+                description=f"Could not fetch content from {url}",
+                salary=None,
+                remote_ok=False,
+            )
+            return job_posting
 
-            # Extract domain for ATS handler lookup
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
+        # Extract domain for ATS handler lookup
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc.lower()
 
-            # Use registered ATS handler if available
-            if domain in ATS_HANDLER:
-                # Create a minimal job posting to pass to the ATS handler
-                job_posting = JobPosting(url=url, source=domain)
-                return ATS_HANDLER[domain](job_posting, html_content)
+        # Parsing is CPU-bound, so it runs in a worker thread: the event loop
+        # keeps serving the other enrichment fetches meanwhile
 
-            # Otherwise, use generic HTML parsing
-            return self._extract_job_details_from_html(html_content, url)
+        # Use registered ATS handler if available, for the host or a parent domain
+        handler = ats_handler_for(parsed_url.hostname or "")
+        if handler is not None:
+            # Create a minimal job posting to pass to the ATS handler
+            job_posting = JobPosting(url=url, source=domain)
+            return await asyncio.to_thread(handler, job_posting, html_content)
 
-        finally:
-            await crawler.close_session()
+        # Otherwise, use generic HTML parsing
+        return await asyncio.to_thread(self._extract_job_details_from_html, html_content, url)
 
     def _extract_job_details_from_html(self, html_content: str, url: str) -> JobPosting:
         """
@@ -606,8 +819,26 @@ class JobService:
         Returns:
             JobPosting with extracted details
         """
+        if len(html_content) >= LARGE_PAGE_CHARS:
+            og = og_meta(html_content)
+            title = og.get("og:title", "")
+            description = og.get("og:description", "")
+            if title and len(description) >= OG_DESCRIPTION_MIN_CHARS:
+                if len(description) > 5000:
+                    description = description[:5000] + "..."
+                return JobPosting(
+                    url=url,
+                    source=urlparse(url).netloc,
+                    title=title,
+                    company=og.get("og:site_name") or "Unknown Company",
+                    location="Location Not Specified",
+                    description=description,
+                    salary=None,
+                    remote_ok="remote" in (description + " " + title).lower(),
+                )
+
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, SOUP_FEATURES)
 
             # Extract domain for source
             parsed_url = urlparse(url)
@@ -618,20 +849,7 @@ class JobService:
                 element.decompose()
 
             # Try to extract title (look for common title selectors)
-            title = None
-            title_selectors = [
-                "h1",
-                '[data-testid="job-title"]',
-                ".job-title",
-                '[class*="title"]',
-                "title",
-            ]
-
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    title = element.get_text(strip=True)
-                    break
+            title = _first_text(_DETAIL_TITLE_SELECTORS, soup)
 
             # If no title found, try meta tags
             if not title:
@@ -641,65 +859,14 @@ class JobService:
                 if title_meta:
                     title = title_meta.get("content", "")
 
-            # Try to extract company name
-            company = None
-            company_selectors = [
-                '[data-testid="company-name"]',
-                ".company-name",
-                '[class*="company"]',
-                "[data-company]",
-            ]
-
-            for selector in company_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    company = element.get_text(strip=True)
-                    break
-
-            # Try to extract location
-            location = None
-            location_selectors = [
-                '[data-testid="job-location"]',
-                ".job-location",
-                '[class*="location"]',
-                "[data-location]",
-            ]
-
-            for selector in location_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    location = element.get_text(strip=True)
-                    break
-
-            # Try to extract salary
-            salary = None
-            salary_selectors = [
-                '[data-testid="job-salary"]',
-                ".job-salary",
-                '[class*="salary"]',
-                "[data-salary]",
-            ]
-
-            for selector in salary_selectors:
-                element = soup.select_one(selector)
-                if element and element.get_text(strip=True):
-                    salary = element.get_text(strip=True)
-                    break
+            company = _first_text(_DETAIL_COMPANY_SELECTORS, soup)
+            location = _first_text(_DETAIL_LOCATION_SELECTORS, soup)
+            salary = _first_text(_DETAIL_SALARY_SELECTORS, soup)
 
             # Extract description (main content)
             description = ""
-            description_selectors = [
-                '[data-testid="job-description"]',
-                ".job-description",
-                '[class*="description"]',
-                '[class*="job-posting"]',
-                "main",
-                "article",
-                ".content",
-            ]
-
-            for selector in description_selectors:
-                element = soup.select_one(selector)
+            for sel in _DETAIL_DESCRIPTION_SELECTORS:
+                element = sel.select_one(soup)
                 if element:
                     # Get text content and clean it up
                     desc_text = element.get_text(separator=" ", strip=True)
@@ -746,12 +913,42 @@ class JobService:
                 remote_ok=False,
             )
 
+    def job_stats(self, full: bool = False) -> Dict[str, Dict[str, int]]:
+        """Cached job totals per started source.
+
+        Reads the crawlers' running counters; full=True recounts the cached
+        lists instead, for checking the counters against the data.
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        for name, crawler in self._instances.items():
+            if not crawler.last_crawl:
+                continue  # never crawled
+            if full:
+                cached = [j for v in crawler.cache.values() for j in v]
+                stats[name] = {
+                    "total_jobs": len(cached),
+                    "remote_jobs": len([j for j in cached if j.remote_ok]),
+                }
+            else:
+                stats[name] = {
+                    "total_jobs": crawler.total_count,
+                    "remote_jobs": crawler.remote_count,
+                }
+        return stats
+
     async def close(self) -> None:
         """Close all crawler sessions."""
+        crawlers = list(self._instances.values())
+        if self._enrich_crawler is not None:
+            crawlers.append(self._enrich_crawler)
         _ = await asyncio.gather(
-            *(c.close_session() for c in self._instances.values()),
+            *(c.close_session() for c in crawlers),
             return_exceptions=True,
         )
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._initialized.clear()
 
     # Async context manager methods
     async def __aenter__(self):
@@ -328,5 +328,5 @@ def to_standardized_dict(job_posting: JobPosting) -> Dict[str, Any]:
         "tags": job_posting.tags,
         "requirements": job_posting.requirements,
         "seniority": job_posting.seniority,
-        "data_quality": assess_data_quality(job_posting.__dict__)
+        "data_quality": assess_data_quality(job_posting.fields_dict())
     }
\ No newline at end of file
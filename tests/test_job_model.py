@@ -0,0 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jobboard_mcp.models.job import JobPosting, canonical_url
+
+
+def test_canonical_url_drops_tracking_and_normalizes_host():
+    assert (
+        canonical_url(" HTTPS://Acme.Example/Jobs/1/?ref=hn&id=7#apply ")
+        == "https://acme.example/Jobs/1?id=7"
+    )
+
+
+def test_malformed_url_falls_back_to_stripped_url():
+    assert canonical_url("  https://[foo/bar ") == "https://[foo/bar"
+    job = JobPosting(url="https://[foo/bar", title="Backend Engineer")
+    assert job.canonical_key == ("https://[foo/bar",)
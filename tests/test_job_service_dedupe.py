@@ -0,0 +1,112 @@
+import asyncio
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jobboard_mcp.models.job import JobPosting
+from jobboard_mcp.tools.jobs import JobService
+
+
+def _service_with_cached_jobs():
+    """JobService whose crawlers serve fixed postings from their own caches."""
+    service = JobService()
+    postings = {
+        "hackernews_jobs": [
+            JobPosting(
+                url="https://acme.example/jobs/1?ref=hn",
+                source="HN Jobs",
+                title="Backend Engineer",
+                company="Acme",
+                location="Unknown",
+                tags=["python"],
+            )
+        ],
+        "workatastartup": [
+            JobPosting(
+                url="https://acme.example/jobs/1",
+                source="Work at a Startup",
+                title="Backend Engineer",
+                company="Acme",
+                location="Berlin",
+                remote_ok=True,
+                tags=["backend"],
+            )
+        ],
+    }
+    for name, jobs in postings.items():
+        crawler = service._instances[name]
+        crawler.store_cache(crawler.KEY, jobs)
+
+        async def crawl(crawler=crawler, **_):
+            return crawler.cache[crawler.KEY]
+
+        crawler.crawl = crawl
+    return service
+
+
+async def _search(service, sources, remote_only=False, location=""):
+    return await service.search_jobs(
+        keywords=None, sources=sources, location=location, remote_only=remote_only, enrich=False
+    )
+
+
+def _cached_fields(service):
+    return {
+        name: [j.fields_dict() for j in crawler.cache[crawler.KEY]]
+        for name, crawler in service._instances.items()
+        if crawler.cache
+    }
+
+
+def test_merged_duplicates_do_not_modify_cached_postings():
+    async def run():
+        service = _service_with_cached_jobs()
+        before = copy.deepcopy(_cached_fields(service))
+        async with service:
+            for _ in range(2):
+                jobs = await _search(service, ["hackernews_jobs", "workatastartup"])
+                assert len(jobs) == 1
+                assert jobs[0].location == "Berlin"
+                assert jobs[0].remote_ok is True
+                assert jobs[0].tags == ["python", "backend"]
+        assert _cached_fields(service) == before
+
+    asyncio.run(run())
+
+
+def test_merge_does_not_leak_into_single_source_search():
+    async def run():
+        async with _service_with_cached_jobs() as service:
+            hn_only = dict(remote_only=True, location="berlin")
+            assert await _search(service, ["hackernews_jobs"], **hn_only) == []
+            await _search(service, ["hackernews_jobs", "workatastartup"])
+            assert await _search(service, ["hackernews_jobs"], **hn_only) == []
+
+    asyncio.run(run())
+
+
+def test_duplicates_resolve_in_request_order_not_completion_order():
+    async def run():
+        async with JobService() as service:
+            delays = {"slow": 0.05, "fast": 0.0}
+
+            async def run_source(source, *_):
+                await asyncio.sleep(delays[source])
+                return [
+                    JobPosting(
+                        url="https://acme.example/jobs/1",
+                        source=source,
+                        title="Backend Engineer",
+                        company="Acme",
+                        location="Remote",
+                        tags=[source],
+                    )
+                ]
+
+            service._run_source = run_source
+            jobs = await _search(service, ["slow", "fast"])
+        assert [(j.source, j.tags) for j in jobs] == [("slow", ["slow", "fast"])]
+
+    asyncio.run(run())
@@ -0,0 +1,25 @@
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+import main
+from jobboard_mcp.models.job import JobPosting
+
+
+class _FakeService:
+    async def parse_job_url(self, url):
+        return JobPosting(url=url, title="Backend Engineer", company="Acme")
+
+
+def test_parse_mode_emits_posting_fields(capsys):
+    code = asyncio.run(main.run_parse(_FakeService(), "https://acme.example/jobs/1", True))
+    event = json.loads(capsys.readouterr().out)
+    assert code == 0
+    assert event["type"] == "parsed"
+    assert event["url"] == "https://acme.example/jobs/1"
+    assert event["company"] == "Acme"
@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jobboard_mcp.parsing.utils import cache_stats, normalize_text
+
+
+def _lookups():
+    stats = cache_stats().get("normalize_text", {"hits": 0, "misses": 0})
+    return stats["hits"] + stats["misses"]
+
+
+def test_short_text_bypasses_the_normalize_cache():
+    before = _lookups()
+    assert normalize_text("  Senior \n Engineer ") == "Senior Engineer"
+    assert _lookups() == before
+
+
+def test_long_text_is_memoized():
+    text = "word \n " * 400
+    normalize_text.cache_clear()
+    before = cache_stats()["normalize_text"]["hits"]
+    first = normalize_text(text)
+    assert normalize_text(text) == first == " ".join(["word"] * 400)
+    assert cache_stats()["normalize_text"]["hits"] == before + 1
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jobboard_mcp.parsing import utils
+from jobboard_mcp.parsing.utils import extract_tech_stack
+
+
+@pytest.fixture
+def regex_only(monkeypatch):
+    monkeypatch.setattr(utils, "_TECH_AC", None)
+    extract_tech_stack.cache_clear()
+    yield
+    extract_tech_stack.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Python3 services", ["Python"]),
+        ("NodeJS and ReactJS", ["Node.js", "React"]),
+        ("JavaScript", ["Java"]),
+        ("AWS, GCP or Azure on Kubernetes", ["AWS", "Azure", "GCP", "Kubernetes"]),
+        ("no stack here", []),
+    ],
+)
+def test_regex_path_matches_substrings(regex_only, text, expected):
+    assert extract_tech_stack(text) == expected
+
+
+@pytest.mark.skipif(utils._TECH_AC is None, reason="pyahocorasick not installed")
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Python3 services",
+        "NodeJS and ReactJS",
+        "JavaScript, TypeScript and Java",
+        "reactypescript",
+        "AWS/GCP/Azure + kubernetes",
+        "no stack here",
+        "",
+    ],
+)
+def test_automaton_and_regex_paths_agree(monkeypatch, text):
+    extract_tech_stack.cache_clear()
+    via_automaton = extract_tech_stack(text)
+    monkeypatch.setattr(utils, "_TECH_AC", None)
+    extract_tech_stack.cache_clear()
+    via_regex = extract_tech_stack(text)
+    extract_tech_stack.cache_clear()
+    assert via_automaton == via_regex